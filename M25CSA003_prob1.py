@@ -9,8 +9,63 @@
 #               3. Detect moods including handling typos/spelling mistakes.
 # ==============================================================================
 
+import argparse
+import csv
+import json
 import re
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
+from itertools import islice
+
+MONTH_MAP = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12
+}
+
+# List of date patterns, in priority order.
+# Tuple structure: (Regex Pattern, Order of parts)
+# Order codes: 'd_mon_y', 'mon_d_y', 'ymd', 'dmy'
+DOB_PATTERNS = [
+    # 1. Word-based formats (e.g., 15 Jan 2000, Jan 15 2000)
+    # Matches: "15 jan 2000", "15-january-00", "15th jan 2000"
+    (r"(\d{1,2})(?:st|nd|rd|th)?[\s\-\./]+([a-z]{3,})[\s\-\./,]+(\d{2,4})", "d_mon_y"),
+
+    # Matches: "Jan 15 2000", "February 2nd, 1998"
+    # (?<![a-z]): the month word can't start mid-word. Same leftmost match,
+    # but a long run of letters is no longer retried from every position.
+    (r"(?<![a-z])([a-z]{3,})\s+(\d{1,2})(?:st|nd|rd|th)?,?[\s\-\./,]+(\d{2,4})", "mon_d_y"),
+
+    # 2. Numeric formats with separators (-, /, space, .)
+    # CAUTION: 01-02-2000 is ambiguous. We prioritize DMY (Indian standard) over MDY.
+
+    # YYYY-MM-DD (ISO format, very safe)
+    (r"(\d{4})[\-\./\s]+(\d{1,2})[\-\./\s]+(\d{1,2})", "ymd"),
+
+    # DD-MM-YYYY or DD/MM/YYYY
+    (r"(\d{1,2})[\-\./\s]+(\d{1,2})[\-\./\s]+(\d{4})", "dmy"),
+
+    # DD-MM-YY (Two digit year)
+    (r"(\d{1,2})[\-\./\s]+(\d{1,2})[\-\./\s]+(\d{2})", "dmy"),
+
+    # Special case mentioned in prompt: "ddmm-yy" (e.g., 2509-01)
+    (r"(\d{2})(\d{2})\-(\d{2,4})", "dmy")
+]
+
+# Which group holds (day, month, year) for each order code, and whether the
+# month is a name ("jan") rather than a number
+DOB_PART_ORDER = {
+    "d_mon_y": (0, 1, 2, True),
+    "mon_d_y": (1, 0, 2, True),
+    "ymd": (2, 1, 0, False),
+    "dmy": (0, 1, 2, False),
+}
+
+# The date engine: every pattern compiled once, in priority order, with its
+# group layout resolved up front.
+DOB_ENGINE = [(re.compile(pattern).search, *DOB_PART_ORDER[fmt]) for pattern, fmt in DOB_PATTERNS]
 
 # ------------------------------------------------------------------------------
 # Function: get_month_number
@@ -20,24 +75,20 @@ from datetime import date
 def get_month_number(month_text):
     if not month_text:
         return None
-        
-    # Standardize input to lowercase substring for easier matching
-    m = month_text.lower()[:3]  # taking first 3 chars handles Jan/January
-    
-    month_map = {
-        "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
-        "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12
-    }
-    return month_map.get(m)
+
+    # taking first 3 chars handles Jan/January
+    return MONTH_MAP.get(month_text.lower()[:3])
 
 # ------------------------------------------------------------------------------
 # Function: normalize_year
 # Description: Handles 2-digit years.
 #              Assumption: 00-26 -> 2000-2026, 27-99 -> 1927-1999.
+#              current_year (2 digits) defaults to today's.
 # ------------------------------------------------------------------------------
-def normalize_year(year):
+def normalize_year(year, current_year=None):
     if year < 100:
-        current_year = date.today().year % 100
+        if current_year is None:
+            current_year = date.today().year % 100
         # If year is 00-26 (or current year), assume 2000s
         if year <= current_year + 1: # +1 buffer
             return 2000 + year
@@ -47,180 +98,594 @@ def normalize_year(year):
 
 # ------------------------------------------------------------------------------
 # Function: extract_dob_auto
-# Description: Iterates through a list of regex patterns to automatically detect
-#              the date format without asking the user.
+# Description: Runs the precompiled DOB_ENGINE over the text to automatically
+#              detect the date format without asking the user. The first
+#              pattern (in priority order) whose match has a valid month wins.
 # Returns: (day, month, year) tuple or None if no match found.
 # ------------------------------------------------------------------------------
-def extract_dob_auto(text):
+def extract_dob_auto(text, current_year=None):
     text = text.strip().lower()
 
-    # List of patterns to check. 
-    # Tuple structure: (Regex Pattern, Order of parts)
-    # Order codes: 'dmy' (Day-Month-Year), 'mdy', 'ymd'
-    patterns = [
-        # 1. Word-based formats (e.g., 15 Jan 2000, Jan 15 2000)
-        # Matches: "15 jan 2000", "15-january-00", "15th jan 2000"
-        (r"(\d{1,2})(?:st|nd|rd|th)?[\s\-\./]+([a-z]{3,})[\s\-\./,]+(\d{2,4})", "d_mon_y"),
-        
-        # Matches: "Jan 15 2000", "February 2nd, 1998"
-        (r"([a-z]{3,})\s+(\d{1,2})(?:st|nd|rd|th)?,?[\s\-\./,]+(\d{2,4})", "mon_d_y"),
-
-        # 2. Numeric formats with separators (-, /, space, .)
-        # CAUTION: 01-02-2000 is ambiguous. We prioritize DMY (Indian standard) over MDY.
-        
-        # YYYY-MM-DD (ISO format, very safe)
-        (r"(\d{4})[\-\./\s]+(\d{1,2})[\-\./\s]+(\d{1,2})", "ymd"),
-
-        # DD-MM-YYYY or DD/MM/YYYY
-        (r"(\d{1,2})[\-\./\s]+(\d{1,2})[\-\./\s]+(\d{4})", "dmy"),
-
-        # DD-MM-YY (Two digit year)
-        (r"(\d{1,2})[\-\./\s]+(\d{1,2})[\-\./\s]+(\d{2})", "dmy"),
-        
-        # Special case mentioned in prompt: "ddmm-yy" (e.g., 2509-01)
-        (r"(\d{2})(\d{2})\-(\d{2,4})", "dmy") 
-    ]
-
-    for pattern, fmt in patterns:
-        match = re.search(pattern, text)
-        if match:
-            groups = match.groups()
-            
-            try:
-                day, month, year = 0, 0, 0
-                
-                if fmt == "d_mon_y":
-                    day = int(groups[0])
-                    month = get_month_number(groups[1])
-                    year = int(groups[2])
-                
-                elif fmt == "mon_d_y":
-                    month = get_month_number(groups[0])
-                    day = int(groups[1])
-                    year = int(groups[2])
-                
-                elif fmt == "ymd":
-                    year = int(groups[0])
-                    month = int(groups[1])
-                    day = int(groups[2])
-                
-                elif fmt == "dmy":
-                    day = int(groups[0])
-                    month = int(groups[1])
-                    year = int(groups[2])
-
-                # Validate month range for numeric parse
-                if month is None or not (1 <= month <= 12):
-                    continue # Try next pattern if month is invalid
-                
-                year = normalize_year(year)
-                
-                return day, month, year
-
-            except ValueError:
-                continue # If conversion fails, try next pattern
+    for search, day_idx, month_idx, year_idx, month_is_name in DOB_ENGINE:
+        match = search(text)
+        if match is None:
+            continue
+
+        groups = match.groups()
+        if month_is_name:
+            month = MONTH_MAP.get(groups[month_idx][:3])
+        else:
+            month = int(groups[month_idx])
+
+        # Validate month range; if invalid, try next pattern
+        if month is None or not (1 <= month <= 12):
+            continue
+
+        return int(groups[day_idx]), month, normalize_year(int(groups[year_idx]), current_year)
 
     return None
 
+# ------------------------------------------------------------------------------
+# Function: extract_dob_many
+# Description: Batch version of extract_dob_auto for large numbers of inputs.
+#              Two-digit years are resolved against the year the batch started.
+# Returns: list of (day, month, year) tuples / None, in input order.
+# ------------------------------------------------------------------------------
+def extract_dob_many(texts):
+    current_year = date.today().year % 100
+    extract = extract_dob_auto
+    return [extract(text, current_year) for text in texts]
+
 # ------------------------------------------------------------------------------
 # Function: calculate_age
+# Description: Age in whole years on `today` (defaults to the current date).
 # ------------------------------------------------------------------------------
-def calculate_age(day, month, year):
-    today = date.today()
+def calculate_age(day, month, year, today=None):
+    if today is None:
+        today = date.today()
     age = today.year - year
     # Subtract 1 if birthday hasn't happened yet this year
     if (today.month, today.day) < (month, day):
         age -= 1
     return age
 
+# ------------------------------------------------------------------------------
+# Columnar date parsing (needs numpy + pandas)
+# Description: Whole columns of raw date strings at once. Strings that are
+#              nothing but a common numeric date ("2000-01-15", "15/01/2000",
+#              "15.01.00", "15 01 2000") are decoded with numpy operations on
+#              their character codes; for those, the first numeric pattern in
+#              DOB_PATTERNS is guaranteed to match exactly these three digit
+#              runs, so the result is the same as extract_dob_auto's. Every
+#              other row (month names, extra words, invalid months, non-ASCII
+#              digits) goes through extract_dob_auto.
+# ------------------------------------------------------------------------------
+NUMERIC_DATE_WIDTH = 10     # longest fast-path string: "2000-12-31", "31/12/2000"
+COLUMN_CHUNK_ROWS = 100000  # rows decoded per numpy block (bounds temporaries)
+DATE_SEPARATORS = [ord("-"), ord("."), ord("/"), ord(" ")]
+
+# ------------------------------------------------------------------------------
+# Function: _columnar_libs
+# Description: Imports numpy and pandas on first use, so only the columnar
+#              path pays for them (the chatbot, batch workers and the chat
+#              server never load them).
+# Returns: (numpy, pandas)
+# ------------------------------------------------------------------------------
+def _columnar_libs():
+    try:
+        import numpy
+        import pandas
+    except ImportError as exc:
+        raise ImportError("extract_dob_column needs numpy and pandas (pip install pandas)") from exc
+    return numpy, pandas
+
+# ------------------------------------------------------------------------------
+# Function: _numeric_date_parts
+# Description: Decodes a block of stripped strings of the shape
+#              <digits><sep><digits><sep><digits>. Returns (is_iso, is_dmy,
+#              first, second, third): yyyy-m-d and d-m-yy(yy) row masks and
+#              the integer value of each digit run.
+# ------------------------------------------------------------------------------
+def _numeric_date_parts(stripped):
+    np, _ = _columnar_libs()
+    width = NUMERIC_DATE_WIDTH
+    lengths = np.fromiter(map(len, stripped), dtype=np.int64, count=len(stripped))
+    fits = lengths <= width
+    lengths = np.where(fits, lengths, 0)
+
+    chars = np.array([text if short else "" for text, short in zip(stripped, fits)], dtype=f"U{width}")
+    codes = chars.view(np.uint32).reshape(len(stripped), width).astype(np.int64)
+
+    pos = np.arange(width)
+    inside = pos < lengths[:, None]
+    is_digit = (codes >= 48) & (codes <= 57)
+    is_sep = np.isin(codes, DATE_SEPARATORS) & inside
+    seps_so_far = np.cumsum(is_sep, axis=1)
+
+    well_formed = fits & ~(inside & ~is_digit & ~is_sep).any(axis=1) & (seps_so_far[:, -1] == 2)
+    sep1 = np.argmax(is_sep, axis=1)
+    sep2 = np.argmax(is_sep & (seps_so_far == 2), axis=1)
+    len1, len2, len3 = sep1, sep2 - sep1 - 1, lengths - sep2 - 1
+
+    # Value of each digit run: sum of digit * 10**(places left in its run)
+    run = seps_so_far - is_sep
+    run_end = np.where(run == 0, sep1[:, None], np.where(run == 1, sep2[:, None], lengths[:, None]))
+    place = 10 ** np.clip(run_end - pos - 1, 0, width)
+    digits = np.where(inside & is_digit, (codes - 48) * place, 0)
+    first, second, third = ((digits * (run == k)).sum(axis=1) for k in range(3))
+
+    short2 = (len2 >= 1) & (len2 <= 2)
+    is_iso = well_formed & (len1 == 4) & short2 & (len3 >= 1) & (len3 <= 2)
+    is_dmy = well_formed & (len1 >= 1) & (len1 <= 2) & short2 & ((len3 == 2) | (len3 == 4))
+    return is_iso, is_dmy, first, second, third
+
+# ------------------------------------------------------------------------------
+# Function: calculate_ages
+# Description: Vectorized calculate_age over numpy arrays, against one fixed
+#              reference date.
+# ------------------------------------------------------------------------------
+def calculate_ages(days, months, years, today=None):
+    if today is None:
+        today = date.today()
+    # Subtract 1 where the birthday hasn't happened yet this year
+    not_yet = (months > today.month) | ((months == today.month) & (days > today.day))
+    return today.year - years - not_yet
+
+# ------------------------------------------------------------------------------
+# Function: extract_dob_column
+# Description: Columnar extract_dob_auto + calculate_age. `values` is any
+#              sequence, numpy array or pandas Series of raw date strings
+#              (None/NaN count as unparsable).
+# Returns: DataFrame (same index as a Series input) with nullable integer
+#          columns day, month, year and age; <NA> where no date was found.
+# ------------------------------------------------------------------------------
+def extract_dob_column(values, today=None):
+    np, pd = _columnar_libs()
+    if today is None:
+        today = date.today()
+    current_year = today.year % 100
+
+    raw = values if isinstance(values, pd.Series) else pd.Series(values, dtype=object)
+    raw_text = raw.where(raw.notna(), "").astype(str).tolist()
+
+    size = len(raw_text)
+    days = np.zeros(size, dtype=np.int64)
+    months = np.zeros(size, dtype=np.int64)
+    years = np.zeros(size, dtype=np.int64)
+    parsed = np.zeros(size, dtype=bool)
+
+    # 1. Fast path: whole-string numeric dates, decoded block by block
+    for lo in range(0, size, COLUMN_CHUNK_ROWS):
+        block = slice(lo, lo + COLUMN_CHUNK_ROWS)
+        stripped = [text.strip() for text in raw_text[block]]
+        is_iso, is_dmy, first, second, third = _numeric_date_parts(stripped)
+        days[block] = np.where(is_iso, third, first)
+        months[block] = second
+        years[block] = np.where(is_iso, first, third)
+        parsed[block] = (is_iso | is_dmy) & (second >= 1) & (second <= 12)
+
+    # Two-digit years, same rule as normalize_year
+    short = parsed & (years < 100)
+    years[short] += np.where(years[short] <= current_year + 1, 2000, 1900)
+
+    # 2. Everything else (and invalid months): the regular parser, row by row
+    for row in np.flatnonzero(~parsed).tolist():
+        dob = extract_dob_auto(raw_text[row], current_year)
+        if dob:
+            days[row], months[row], years[row] = dob
+            parsed[row] = True
+
+    # 3. Ages for all rows in one step
+    ages = calculate_ages(days, months, years, today)
+
+    missing = ~parsed
+    return pd.DataFrame({
+        "day": pd.arrays.IntegerArray(days, missing),
+        "month": pd.arrays.IntegerArray(months, missing),
+        "year": pd.arrays.IntegerArray(years, missing),
+        "age": pd.arrays.IntegerArray(ages.astype(np.int64), missing.copy()),
+    }, index=raw.index)
+
+SURNAME_RE = re.compile(r"(?<!\w)(\w+)$")
+
 # ------------------------------------------------------------------------------
 # Function: extract_surname
 # Description: Extracts the last word of a string as the surname.
 # ------------------------------------------------------------------------------
 def extract_surname(full_name):
     # Regex to find the last word in the string
-    # \b indicates word boundary, \w+ is the word
+    # (?<!\w) anchors it at a word boundary so a long word isn't retried from
+    # every position inside it; \w+ is the word
     clean_name = full_name.strip()
-    match = re.search(r"(\w+)$", clean_name)
+    match = SURNAME_RE.search(clean_name)
     if match:
         return match.group(1)
     return None
 
+# Dictionary of regex patterns for moods, in priority order.
+# We use flexible patterns to catch typos (e.g., 'hap.*y' matches 'happy', 'hapy')
+# Each alternative must be a plain word, or 'head.*tail' with plain words.
+MOOD_PATTERNS = {
+    "anger": r"ang.*r|mad|fur.*i|annoy|frust.*|irrit.*",
+    "disgust": r"disgust|gross|yuck|nasty|awful",
+    "fear": r"fear|scar.*d|afraid|terr.*|worr.*",
+    "happiness": r"hap.*y|joy|glad|excit.*|good|great|amaz.*",
+    "sadness": r"sad|depres.*|cry.*|lonel.*|sorrow|unhap.*|low",
+    "surprise": r"wow|omg|shock.*|surpris.*|amaz.*"
+}
+
+# ------------------------------------------------------------------------------
+# Function: _trie_regex
+# Description: Turns a list of plain words into one trie-shaped regex, e.g.
+#              ['sad', 'scar', 'shock'] -> 's(?:ad|car|hock)'. At each
+#              position the regex engine then checks one branch per distinct
+#              next letter instead of every word. The longest word wins.
+# ------------------------------------------------------------------------------
+def _trie_regex(words):
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}  # end-of-word marker
+
+    def emit(node):
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            body = (body if len(branches) == 1 and len(body) == 1 else f"(?:{body})") + "?"
+        return body
+
+    return emit(trie)
+
+# ------------------------------------------------------------------------------
+# Function: _build_mood_matcher
+# Description: Compiles MOOD_PATTERNS into one matcher. Every keyword head
+#              ('hap' of 'hap.*y', 'mad', ...) goes into a single trie regex,
+#              so one left-to-right scan reports every position where any
+#              mood keyword starts. Returns the regex and
+#              head -> [(mood index, head length, tail)], where tail is ''
+#              for plain words.
+#              A head also carries the entries of shorter heads that are its
+#              prefix, since the regex reports only the longest one.
+# ------------------------------------------------------------------------------
+def _build_mood_matcher(mood_patterns):
+    entries = {}
+    for index, pattern in enumerate(mood_patterns.values()):
+        for alternative in pattern.split("|"):
+            head, _, tail = alternative.partition(".*")
+            for word in (head, tail):
+                if re.escape(word) != word:
+                    raise ValueError(f"unsupported mood pattern: {alternative!r}")
+            entries.setdefault(head, []).append((index, len(head), tail))
+
+    hits = {head: [entry for other in entries if head.startswith(other) for entry in entries[other]]
+            for head in entries}
+    return re.compile(_trie_regex(entries)), hits
+
+MOOD_NAMES = list(MOOD_PATTERNS)
+MOOD_MATCHER, MOOD_HITS = _build_mood_matcher(MOOD_PATTERNS)
+
 # ------------------------------------------------------------------------------
 # Function: detect_mood
-# Description: Identifies mood using regex keywords, handling typos.
+# Description: Identifies mood using regex keywords, handling typos. Scans the
+#              text once with MOOD_MATCHER (restarting one character after
+#              each hit, so overlapping keywords are all seen); 'head.*tail'
+#              keywords are confirmed by checking that the tail occurs later
+#              on the same line (what '.*' allows). The first mood in
+#              MOOD_PATTERNS order that has any hit wins.
+#              With full_score=True, returns {mood: hits} instead, counting
+#              the positions in the text where one of that mood's keywords
+#              starts.
 # ------------------------------------------------------------------------------
-def detect_mood(text):
+def detect_mood(text, full_score=False):
     text = text.lower()
-    
-    # Dictionary of regex patterns for moods.
-    # We use flexible patterns to catch typos (e.g., 'hap.*y' matches 'happy', 'hapy')
-    mood_patterns = {
-        "anger": r"ang.*r|mad|fur.*i|annoy|frust.*|irrit.*",
-        "disgust": r"disgust|gross|yuck|nasty|awful",
-        "fear": r"fear|scar.*d|afraid|terr.*|worr.*",
-        "happiness": r"hap.*y|joy|glad|excit.*|good|great|amaz.*",
-        "sadness": r"sad|depres.*|cry.*|lonel.*|sorrow|unhap.*|low",
-        "surprise": r"wow|omg|shock.*|surpris.*|amaz.*"
-    }
-
-    for mood, pattern in mood_patterns.items():
-        if re.search(pattern, text):
-            return mood
-    
+    search = MOOD_MATCHER.search
+
+    counts = [0] * len(MOOD_NAMES)
+    best = len(MOOD_NAMES)
+    line_start, line_end = 0, -1
+    last_tail = {}  # tail -> last position on the current line
+
+    match = search(text)
+    while match:
+        pos = match.start()
+        head = match.group()
+
+        if pos > line_end:
+            line_start = text.rfind("\n", 0, pos) + 1
+            line_end = text.find("\n", pos)
+            if line_end < 0:
+                line_end = len(text)
+            last_tail = {}
+
+        seen = set()
+        for index, head_len, tail in MOOD_HITS[head]:
+            if index in seen:
+                continue
+            if tail:
+                if tail not in last_tail:
+                    last_tail[tail] = text.rfind(tail, line_start, line_end)
+                if last_tail[tail] < pos + head_len:
+                    continue
+            seen.add(index)
+            counts[index] += 1
+            best = min(best, index)
+
+        if best == 0 and not full_score:
+            break
+        match = search(text, pos + 1)
+
+    if full_score:
+        return dict(zip(MOOD_NAMES, counts))
+    if best < len(MOOD_NAMES):
+        return MOOD_NAMES[best]
     return "unknown"
 
+MOOD_RESPONSES = {
+    "anger": "Reggy: Take a deep breath. It's okay to be upset sometimes.",
+    "disgust": "Reggy: Eww! That sounds unpleasant.",
+    "fear": "Reggy: You are safe here. Don't worry.",
+    "happiness": "Reggy: That's wonderful! Your happiness is contagious!",
+    "sadness": "Reggy: I'm sorry to hear that. Sending virtual hugs. <3",
+    "surprise": "Reggy: Whoa! I wasn't expecting that either!",
+    "unknown": "Reggy: I see. Thanks for sharing that with me."
+}
+
 # ------------------------------------------------------------------------------
-# Function: main
+# Class: ReggySession
+# Description: The three-step dialog (name -> DOB -> mood) as a state machine
+#              with no I/O of its own. start() returns Reggy's opening lines;
+#              reply(text) takes one user message, advances the state and
+#              returns Reggy's answer (ending with the next question). The
+#              console loop in main() and the chat server both drive it.
 # ------------------------------------------------------------------------------
-def main():
-    print("\n" + "="*40)
-    print("      REGGY++ : The Regex Chatbot      ")
-    print("="*40)
+class ReggySession:
+    ASK_NAME, ASK_DOB, ASK_MOOD, DONE = "name", "dob", "mood", "done"
+
+    def __init__(self, today=None):
+        self.state = self.ASK_NAME
+        self.today = today
+        self.surname = None
+        self.dob = None
+        self.mood = None
+
+    @property
+    def done(self):
+        return self.state == self.DONE
+
+    def start(self):
+        return [
+            "\n" + "="*40,
+            "      REGGY++ : The Regex Chatbot      ",
+            "="*40,
+            "Reggy: Hello! What is your full name?",
+        ]
+
+    def reply(self, text):
+        if self.state == self.ASK_NAME:
+            return self._on_name(text)
+        if self.state == self.ASK_DOB:
+            return self._on_dob(text)
+        if self.state == self.ASK_MOOD:
+            return self._on_mood(text)
+        raise ValueError("conversation is already over")
 
     # --- Step 1: Name Detection ---
-    name_input = input("Reggy: Hello! What is your full name?\nYou:   ")
-    surname = extract_surname(name_input)
-    
-    if surname:
-        print(f"Reggy: Nice to meet you, Mr./Ms. {surname}!")
-    else:
-        print("Reggy: Nice to meet you!")
+    def _on_name(self, text):
+        self.surname = extract_surname(text)
+        if self.surname:
+            lines = [f"Reggy: Nice to meet you, Mr./Ms. {self.surname}!"]
+        else:
+            lines = ["Reggy: Nice to meet you!"]
+
+        self.state = self.ASK_DOB
+        lines.append("\nReggy: When were you born? (You can type it any way you like!)")
+        return lines
 
     # --- Step 2: Date Parsing & Age Calculation ---
-    print("\nReggy: When were you born? (You can type it any way you like!)")
-    dob_input = input("You:   ")
-    
-    dob = extract_dob_auto(dob_input)
-    
+    def _on_dob(self, text):
+        current_year = self.today.year % 100 if self.today else None
+        self.dob = extract_dob_auto(text, current_year)
+        if self.dob:
+            d, m, y = self.dob
+            age = calculate_age(d, m, y, self.today)
+            lines = [f"Reggy: I understood that date: {d:02d}-{m:02d}-{y}",
+                     f"Reggy: That makes you {age} years old."]
+        else:
+            lines = ["Reggy: I'm sorry, I couldn't figure out that date format."]
+
+        self.state = self.ASK_MOOD
+        lines.append("\nReggy: How are you feeling right now?")
+        return lines
+
+    # --- Step 3: Mood Detection ---
+    def _on_mood(self, text):
+        self.mood = detect_mood(text)
+        self.state = self.DONE
+        return [MOOD_RESPONSES[self.mood], "\n" + "="*40, "Reggy: Goodbye!"]
+
+# ------------------------------------------------------------------------------
+# Batch mode
+# Description: Runs the whole Reggy pipeline (surname, DOB + age, mood) over
+#              JSONL or CSV records without any conversation. Each input
+#              record comes back with the RESULT_FIELDS added.
+# ------------------------------------------------------------------------------
+CHUNK_RECORDS = 2000
+RESULT_FIELDS = ["surname", "birth_date", "age", "detected_mood"]
+
+# ------------------------------------------------------------------------------
+# Function: process_record
+# Description: Applies the three Reggy steps to one record (a dict). `fields`
+#              names the input columns holding (name, dob, mood) text; ages
+#              are computed on the fixed date `today`.
+# ------------------------------------------------------------------------------
+def process_record(record, fields, today):
+    name_field, dob_field, mood_field = fields
+    result = dict(record)
+    result["surname"] = extract_surname(str(record.get(name_field) or ""))
+
+    dob = extract_dob_auto(str(record.get(dob_field) or ""), today.year % 100)
     if dob:
         d, m, y = dob
-        age = calculate_age(d, m, y)
-        print(f"Reggy: I understood that date: {d:02d}-{m:02d}-{y}")
-        print(f"Reggy: That makes you {age} years old.")
+        result["birth_date"] = f"{d:02d}-{m:02d}-{y}"
+        result["age"] = calculate_age(d, m, y, today)
     else:
-        print("Reggy: I'm sorry, I couldn't figure out that date format.")
+        result["birth_date"] = None
+        result["age"] = None
 
-    # --- Step 3: Mood Detection ---
-    print("\nReggy: How are you feeling right now?")
-    mood_input = input("You:   ")
-    
-    mood = detect_mood(mood_input)
-    
-    responses = {
-        "anger": "Reggy: Take a deep breath. It's okay to be upset sometimes.",
-        "disgust": "Reggy: Eww! That sounds unpleasant.",
-        "fear": "Reggy: You are safe here. Don't worry.",
-        "happiness": "Reggy: That's wonderful! Your happiness is contagious!",
-        "sadness": "Reggy: I'm sorry to hear that. Sending virtual hugs. <3",
-        "surprise": "Reggy: Whoa! I wasn't expecting that either!",
-        "unknown": "Reggy: I see. Thanks for sharing that with me."
-    }
-    
-    print(responses[mood])
-    
-    print("\n" + "="*40)
-    print("Reggy: Goodbye!")
+    result["detected_mood"] = detect_mood(str(record.get(mood_field) or ""))
+    return result
+
+# ------------------------------------------------------------------------------
+# Function: check_csv_row
+# Description: csv.DictReader puts the values of a row longer than the header
+#              under the key None, which DictWriter refuses to write. Drops
+#              them and notes it in the "error" column instead, so one ragged
+#              row does not abort the batch (like a bad JSONL record).
+# ------------------------------------------------------------------------------
+def check_csv_row(row):
+    extra = row.pop(None, None)
+    if extra is not None:
+        row["error"] = f"bad record: {len(extra)} field(s) more than the header"
+    return row
+
+# ------------------------------------------------------------------------------
+# Function: _process_chunk
+# Description: Worker for run_batch. JSONL chunks arrive as raw lines and go
+#              back as serialized lines; CSV chunks are lists of row dicts.
+# ------------------------------------------------------------------------------
+def _process_chunk(task):
+    fmt, items, fields, today = task
+    if fmt == "csv":
+        return [process_record(check_csv_row(row), fields, today) for row in items]
+
+    out = []
+    for line in items:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+            if not isinstance(record, dict):
+                raise ValueError("record is not a JSON object")
+        except ValueError as exc:
+            out.append(json.dumps({"error": f"bad record: {exc}", "line": line}))
+            continue
+        out.append(json.dumps(process_record(record, fields, today)))
+    return out
+
+def _read_chunks(items, chunk_size):
+    items = iter(items)
+    while True:
+        chunk = list(islice(items, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+# ------------------------------------------------------------------------------
+# Function: run_batch
+# Description: Streams records from `source` (a path, or '-' for stdin) to
+#              `dest` in chunks. With workers > 1 chunks are processed by a
+#              process pool with at most 2 chunks per worker in flight, so
+#              memory stays bounded and the output keeps the input order.
+#              Reports records/sec on stderr.
+# ------------------------------------------------------------------------------
+def run_batch(source, dest="-", fmt=None, workers=1, chunk_size=CHUNK_RECORDS,
+              fields=("name", "dob", "mood")):
+    if fmt is None:
+        path = dest if source == "-" else source
+        fmt = "csv" if path.lower().endswith(".csv") else "jsonl"
+    today = date.today()  # one reference date for the whole batch
+
+    fin = sys.stdin if source == "-" else open(source, 'r', encoding='utf-8', newline='')
+    fout = sys.stdout if dest == "-" else open(dest, 'w', encoding='utf-8', newline='')
+    start = time.perf_counter()
+    count = 0
+    try:
+        if fmt == "csv":
+            reader = csv.DictReader(fin)
+            columns = list(reader.fieldnames or [])
+            writer = csv.DictWriter(fout, columns + [f for f in RESULT_FIELDS + ["error"] if f not in columns])
+            writer.writeheader()
+            records, write = reader, writer.writerows
+        else:
+            records = fin
+            write = lambda lines: fout.write("".join(line + "\n" for line in lines))
+
+        tasks = ((fmt, chunk, fields, today) for chunk in _read_chunks(records, chunk_size))
+        if workers <= 1:
+            for task in tasks:
+                results = _process_chunk(task)
+                count += len(results)
+                write(results)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                pending = deque()
+                for task in tasks:
+                    pending.append(pool.submit(_process_chunk, task))
+                    if len(pending) >= 2 * workers:
+                        results = pending.popleft().result()
+                        count += len(results)
+                        write(results)
+                while pending:
+                    results = pending.popleft().result()
+                    count += len(results)
+                    write(results)
+    finally:
+        if fin is not sys.stdin:
+            fin.close()
+        if fout is not sys.stdout:
+            fout.close()
+        else:
+            fout.flush()
+
+    elapsed = time.perf_counter() - start
+    print(f"Processed {count} records in {elapsed:.2f} s "
+          f"({count / elapsed if elapsed else 0:,.0f} records/sec)", file=sys.stderr)
+    return count
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Reggy++ : The Regex Chatbot")
+    parser.add_argument("--batch", metavar="FILE",
+                        help="process JSONL/CSV records from FILE ('-' for stdin) instead of chatting")
+    parser.add_argument("--out", default="-", metavar="FILE",
+                        help="batch output file (default: stdout)")
+    parser.add_argument("--format", choices=["jsonl", "csv"],
+                        help="batch record format (default: from the file extension, else jsonl)")
+    parser.add_argument("--fields", default="name,dob,mood",
+                        help="input columns holding the name, date of birth and mood text")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="processes used in batch mode")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_RECORDS,
+                        help="records per batch chunk")
+    args = parser.parse_args(argv)
+    args.fields = tuple(args.fields.split(","))
+    if len(args.fields) != 3:
+        parser.error("--fields needs exactly three comma-separated column names")
+    return args
+
+# ------------------------------------------------------------------------------
+# Function: main
+# ------------------------------------------------------------------------------
+def main():
+    args = parse_args(sys.argv[1:])
+    if args.batch:
+        try:
+            run_batch(args.batch, args.out, args.format, args.workers, args.chunk_size, args.fields)
+        except FileNotFoundError as exc:
+            print(f"Error: File '{exc.filename}' not found.")
+            sys.exit(1)
+        return
+
+    session = ReggySession()
+    for line in session.start():
+        print(line)
+    while not session.done:
+        for line in session.reply(input("You:   ")):
+            print(line)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,196 @@
+# ==============================================================================
+# File Name   : M25CSA003_prob1_bench.py
+# Author      : Akshat Jain
+# Roll Number : M25CSA003
+# Description : Benchmarks for the Reggy++ date parser in M25CSA003_prob1.py
+#               - Legacy extract_dob_auto (patterns rebuilt per call) vs the
+#                 precompiled DOB_ENGINE behind extract_dob_many()
+#               - Checks that both return identical results
+#               - Row-by-row parse + age vs columnar extract_dob_column()
+#                 (needs pandas)
+# Usage       : python M25CSA003_prob1_bench.py [--inputs 200000]
+# ==============================================================================
+
+import argparse
+import random
+import re
+import sys
+import time
+
+from datetime import date
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+from M25CSA003_prob1 import (calculate_age, extract_dob_auto, extract_dob_column,
+                             extract_dob_many, normalize_year)
+
+# ------------------------------------------------------------------------------
+# Function: legacy_extract_dob_auto
+# Description: Copy of the original extract_dob_auto (comments trimmed), kept
+#              as the reference for correctness and speed comparisons.
+# ------------------------------------------------------------------------------
+def legacy_get_month_number(month_text):
+    if not month_text:
+        return None
+    m = month_text.lower()[:3]
+    month_map = {
+        "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+        "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12
+    }
+    return month_map.get(m)
+
+def legacy_extract_dob_auto(text):
+    text = text.strip().lower()
+    patterns = [
+        (r"(\d{1,2})(?:st|nd|rd|th)?[\s\-\./]+([a-z]{3,})[\s\-\./,]+(\d{2,4})", "d_mon_y"),
+        (r"([a-z]{3,})\s+(\d{1,2})(?:st|nd|rd|th)?,?[\s\-\./,]+(\d{2,4})", "mon_d_y"),
+        (r"(\d{4})[\-\./\s]+(\d{1,2})[\-\./\s]+(\d{1,2})", "ymd"),
+        (r"(\d{1,2})[\-\./\s]+(\d{1,2})[\-\./\s]+(\d{4})", "dmy"),
+        (r"(\d{1,2})[\-\./\s]+(\d{1,2})[\-\./\s]+(\d{2})", "dmy"),
+        (r"(\d{2})(\d{2})\-(\d{2,4})", "dmy")
+    ]
+
+    for pattern, fmt in patterns:
+        match = re.search(pattern, text)
+        if match:
+            groups = match.groups()
+            try:
+                day, month, year = 0, 0, 0
+                if fmt == "d_mon_y":
+                    day = int(groups[0])
+                    month = legacy_get_month_number(groups[1])
+                    year = int(groups[2])
+                elif fmt == "mon_d_y":
+                    month = legacy_get_month_number(groups[0])
+                    day = int(groups[1])
+                    year = int(groups[2])
+                elif fmt == "ymd":
+                    year = int(groups[0])
+                    month = int(groups[1])
+                    day = int(groups[2])
+                elif fmt == "dmy":
+                    day = int(groups[0])
+                    month = int(groups[1])
+                    year = int(groups[2])
+
+                if month is None or not (1 <= month <= 12):
+                    continue
+                year = normalize_year(year)
+                return day, month, year
+            except ValueError:
+                continue
+
+    return None
+
+# ------------------------------------------------------------------------------
+# Function: synthetic_inputs
+# Description: Form-submission style date strings: every supported format,
+#              invalid months, stray words/numbers around the date, and
+#              inputs with no date at all.
+# ------------------------------------------------------------------------------
+MONTHS = ["jan", "January", "feb", "March", "apr", "May", "june", "Jul",
+          "august", "Sept", "oct", "November", "dec", "foo", "Smarch"]
+SEPARATORS = ["-", "/", ".", " ", " - ", ", "]
+FILLERS = ["", "born on ", "my dob is ", "i was born ", "date: ", "around ",
+           "call me at 98765 43210, ", "flat 12/3b, "]
+
+def synthetic_inputs(count, seed=0):
+    rnd = random.Random(seed)
+
+    def num(lo, hi, width=0):
+        return str(rnd.randint(lo, hi)).zfill(width)
+
+    makers = [
+        lambda s: f"{num(1, 31)}{rnd.choice(['', 'st', 'th'])}{s}{rnd.choice(MONTHS)}{s}{num(0, 2030)}",
+        lambda s: f"{rnd.choice(MONTHS)} {num(1, 31)}{rnd.choice(['', 'nd', ','])}{s}{num(0, 2030)}",
+        lambda s: f"{num(1900, 2030)}{s}{num(1, 14)}{s}{num(1, 31)}",
+        lambda s: f"{num(1, 31)}{s}{num(1, 14)}{s}{num(1900, 2030)}",
+        lambda s: f"{num(1, 31)}{s}{num(1, 14)}{s}{num(0, 99, 2)}",
+        lambda s: f"{num(1, 31, 2)}{num(1, 14, 2)}-{num(0, 99, 2)}",
+        lambda s: rnd.choice(["no idea", "ask my mom", "", "twenty fifth of may",
+                              "2000", "12 34", "born in the 90s"]),
+    ]
+    inputs = []
+    for _ in range(count):
+        text = rnd.choice(makers)(rnd.choice(SEPARATORS))
+        text = rnd.choice(FILLERS) + text + rnd.choice(["", " ", "!", " thanks", " (approx)"])
+        if rnd.random() < 0.5:
+            text = text.upper() if rnd.random() < 0.2 else text.title()
+        inputs.append(text)
+    return inputs
+
+# ------------------------------------------------------------------------------
+# Function: bench_column
+# Description: Row-by-row extract_dob_auto + calculate_age vs the columnar
+#              extract_dob_column on a table dominated by numeric dates.
+# Returns: number of rows where the two disagree.
+# ------------------------------------------------------------------------------
+def bench_column(inputs, seed=0):
+    rnd = random.Random(seed)
+    column = []
+    for text in inputs:
+        if rnd.random() < 0.8:
+            sep = rnd.choice("-/.")
+            day, month = rnd.randint(1, 28), rnd.randint(1, 12)
+            if rnd.random() < 0.5:
+                text = f"{rnd.randint(1950, 2010)}{sep}{month:02d}{sep}{day:02d}"
+            else:
+                text = f"{day:02d}{sep}{month:02d}{sep}{rnd.choice([rnd.randint(1950, 2010), rnd.randint(0, 99)])}"
+        column.append(text)
+    today = date.today()
+
+    start = time.perf_counter()
+    rows = []
+    for text in column:
+        dob = extract_dob_auto(text, today.year % 100)
+        rows.append(None if dob is None else (*dob, calculate_age(*dob, today)))
+    row_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    frame = extract_dob_column(column, today)
+    column_time = time.perf_counter() - start
+
+    got = [None if pd.isna(r.day) else (r.day, r.month, r.year, r.age) for r in frame.itertuples()]
+    mismatches = sum(a != b for a, b in zip(rows, got))
+    print(f"\n--- Row-by-row vs extract_dob_column on {len(column)} rows (80% numeric) ---")
+    print(f"Row-by-row parse + age         : {row_time:8.3f} s ({len(column) / row_time:,.0f} rows/sec)")
+    print(f"extract_dob_column             : {column_time:8.3f} s ({len(column) / column_time:,.0f} rows/sec)")
+    print(f"Speedup                        : {row_time / column_time:8.2f}x")
+    print(f"Mismatches                     : {mismatches}")
+    return mismatches
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Reggy++ date parser.")
+    parser.add_argument("--inputs", type=int, default=200000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    inputs = synthetic_inputs(args.inputs, args.seed)
+
+    start = time.perf_counter()
+    legacy = [legacy_extract_dob_auto(text) for text in inputs]
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    engine = extract_dob_many(inputs)
+    engine_time = time.perf_counter() - start
+
+    mismatches = [(text, a, b) for text, a, b in zip(inputs, legacy, engine) if a != b]
+    parsed = sum(result is not None for result in engine)
+    print(f"\n--- extract_dob_auto on {len(inputs)} inputs ({parsed} parsed) ---")
+    print(f"Legacy (per-call re.search)    : {legacy_time:8.3f} s ({len(inputs) / legacy_time:,.0f} inputs/sec)")
+    print(f"extract_dob_many (precompiled) : {engine_time:8.3f} s ({len(inputs) / engine_time:,.0f} inputs/sec)")
+    print(f"Speedup                        : {legacy_time / engine_time:8.2f}x")
+    print(f"Mismatches                     : {len(mismatches)}")
+    for text, a, b in mismatches[:10]:
+        print(f"  {text!r}: legacy={a} new={b}")
+
+    column_mismatches = bench_column(inputs, args.seed) if pd is not None else 0
+    if mismatches or column_mismatches:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+# ==============================================================================
+# File Name   : M25CSA003_prob1_regex_bench.py
+# Author      : Akshat Jain
+# Roll Number : M25CSA003
+# Description : Regex performance + fuzz regression suite for the Reggy++
+#               parsers in M25CSA003_prob1.py
+#               - Times each parser on pathological inputs (long separator
+#                 runs, long letter runs with no month, keyword floods) as the
+#                 input length doubles, and fits the growth exponent
+#               - Fuzzes the parsers against the original regex versions on
+#                 short random inputs to make sure results did not change
+#               - Exits with status 1 if any parser grows superlinearly or
+#                 disagrees with its reference
+# Usage       : python M25CSA003_prob1_regex_bench.py [--max-len 32000]
+#                   [--max-exponent 1.4] [--fuzz 20000]
+# ==============================================================================
+
+import argparse
+import math
+import random
+import re
+import sys
+import time
+
+from M25CSA003_prob1 import MOOD_PATTERNS, detect_mood, extract_dob_auto, extract_surname
+from M25CSA003_prob1_bench import legacy_extract_dob_auto
+
+# ------------------------------------------------------------------------------
+# Reference implementations (the original per-call regex versions)
+# ------------------------------------------------------------------------------
+def legacy_extract_surname(full_name):
+    match = re.search(r"(\w+)$", full_name.strip())
+    if match:
+        return match.group(1)
+    return None
+
+def legacy_detect_mood(text):
+    text = text.lower()
+    for mood, pattern in MOOD_PATTERNS.items():
+        if re.search(pattern, text):
+            return mood
+    return "unknown"
+
+# ------------------------------------------------------------------------------
+# Pathological inputs
+# Description: (name, parser, generator). A generator builds an input of
+#              about n characters; `rnd` varies the details between samples.
+# ------------------------------------------------------------------------------
+def _letters(rnd, n, alphabet="bcdfghklpqvwxz"):
+    # lowercase without anything that spells a month or mood keyword
+    return "".join(rnd.choice(alphabet) for _ in range(n))
+
+PATHOLOGICAL = [
+    ("dob: long letter run", extract_dob_auto,
+     lambda rnd, n: _letters(rnd, n)),
+    ("dob: letter run then digit", extract_dob_auto,
+     lambda rnd, n: _letters(rnd, n) + " 1"),
+    ("dob: digit then letter run", extract_dob_auto,
+     lambda rnd, n: "1 " + _letters(rnd, n)),
+    ("dob: separator runs", extract_dob_auto,
+     lambda rnd, n: "1" + rnd.choice("-./ ") * (n // 2) + "1" + rnd.choice("-./ ") * (n // 2)),
+    ("dob: month then separators", extract_dob_auto,
+     lambda rnd, n: "1 jan" + rnd.choice(" -./,") * n + "x"),
+    ("dob: digit/separator flood", extract_dob_auto,
+     lambda rnd, n: "".join(rnd.choice(["1", "12", "-", " ", "/"]) for _ in range(n // 2))),
+    ("dob: many short words", extract_dob_auto,
+     lambda rnd, n: " ".join(_letters(rnd, rnd.randint(3, 8)) for _ in range(n // 6))),
+    ("surname: long word + punctuation", extract_surname,
+     lambda rnd, n: _letters(rnd, n) + "!"),
+    ("surname: many words + punctuation", extract_surname,
+     lambda rnd, n: " ".join(_letters(rnd, 5) for _ in range(n // 6)) + "."),
+    ("mood: head without tail", detect_mood,
+     lambda rnd, n: "fur" * (n // 3)),
+    ("mood: keyword flood", detect_mood,
+     lambda rnd, n: "".join(rnd.choice(["hap ", "low ", "scar ", "terr"]) for _ in range(n // 4))),
+    ("mood: many short lines", detect_mood,
+     lambda rnd, n: "ang x\n" * (n // 6)),
+    ("mood: no keywords", detect_mood,
+     lambda rnd, n: _letters(rnd, n, "bkpqvxz ")),
+]
+
+# ------------------------------------------------------------------------------
+# Function: worst_case_times
+# Description: For each input length, the slowest of `samples` inputs, each
+#              timed as the best of `repeats` calls (filters scheduler noise).
+# ------------------------------------------------------------------------------
+def worst_case_times(parser, generator, sizes, samples, repeats, seed):
+    rnd = random.Random(seed)
+    worst = []
+    for n in sizes:
+        slowest = 0.0
+        for _ in range(samples):
+            text = generator(rnd, n)
+            best = math.inf
+            for _ in range(repeats):
+                start = time.perf_counter()
+                parser(text)
+                best = min(best, time.perf_counter() - start)
+            slowest = max(slowest, best)
+        worst.append(slowest)
+    return worst
+
+# ------------------------------------------------------------------------------
+# Function: growth_exponent
+# Description: Least-squares slope of log(time) vs log(length); ~1 for
+#              linear parsers, ~2 for quadratic ones.
+# ------------------------------------------------------------------------------
+def growth_exponent(sizes, times):
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(max(t, 1e-9)) for t in times]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    num = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    den = sum((x - mean_x) ** 2 for x in xs)
+    return num / den
+
+# ------------------------------------------------------------------------------
+# Function: fuzz
+# Description: Random short inputs built from date, name and mood fragments;
+#              every parser must agree with its reference implementation.
+# Returns: list of (parser name, input, expected, got) disagreements.
+# ------------------------------------------------------------------------------
+FRAGMENTS = ["1", "12", "2000", "99", "31", "0", "٣", "-", "/", ".", " ", ",", "  ",
+             "jan", "january", "sept", "foo", "st", "th", "nd", "x", "ab", "\n", "\t",
+             "hap", "y", "ang", "r", "fur", "i", "scar", "d", "unhap", "amaz", "wow",
+             "Smith", "O'Neil", "é", "_", "!"]
+
+def fuzz(count, seed):
+    rnd = random.Random(seed)
+    checks = [
+        ("extract_dob_auto", extract_dob_auto, legacy_extract_dob_auto),
+        ("extract_surname", extract_surname, legacy_extract_surname),
+        ("detect_mood", detect_mood, legacy_detect_mood),
+    ]
+    failures = []
+    for _ in range(count):
+        text = "".join(rnd.choice(FRAGMENTS) for _ in range(rnd.randint(0, 12)))
+        if rnd.random() < 0.3:
+            text = text.upper()
+        for name, parser, reference in checks:
+            expected, got = reference(text), parser(text)
+            if expected != got:
+                failures.append((name, text, expected, got))
+    return failures
+
+def main():
+    parser = argparse.ArgumentParser(description="Regex performance and fuzz suite for the Reggy++ parsers.")
+    parser.add_argument("--min-len", type=int, default=2000, help="shortest pathological input")
+    parser.add_argument("--max-len", type=int, default=32000, help="longest pathological input")
+    parser.add_argument("--samples", type=int, default=3, help="random inputs per length")
+    parser.add_argument("--repeats", type=int, default=3, help="timed calls per input")
+    parser.add_argument("--max-exponent", type=float, default=1.4,
+                        help="fail if time grows faster than length ** this")
+    parser.add_argument("--fuzz", type=int, default=20000, help="number of fuzz inputs")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    sizes = []
+    n = args.min_len
+    while n <= args.max_len:
+        sizes.append(n)
+        n *= 2
+
+    failed = False
+    print("\n--- Worst-case time per call (ms) vs input length ---")
+    print(f"{'case':<34} | " + " | ".join(f"{n:>7}" for n in sizes) + " | exponent")
+    print("-" * (48 + 10 * len(sizes)))
+    for name, func, generator in PATHOLOGICAL:
+        times = worst_case_times(func, generator, sizes, args.samples, args.repeats, args.seed)
+        exponent = growth_exponent(sizes, times)
+        verdict = "" if exponent <= args.max_exponent else "  <-- SUPERLINEAR"
+        failed |= bool(verdict)
+        print(f"{name:<34} | " + " | ".join(f"{t * 1000:>7.2f}" for t in times)
+              + f" | {exponent:8.2f}{verdict}")
+
+    failures = fuzz(args.fuzz, args.seed)
+    print(f"\n--- Fuzz: {args.fuzz} random inputs x 3 parsers ---")
+    print(f"Disagreements with the reference regexes: {len(failures)}")
+    for name, text, expected, got in failures[:10]:
+        print(f"  {name}({text!r}): expected {expected!r}, got {got!r}")
+    failed |= bool(failures)
+
+    if failed:
+        sys.exit(1)
+    print(f"\nAll parsers linear (exponent <= {args.max_exponent}) and consistent.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+# ==============================================================================
+# File Name   : M25CSA003_prob1_server.py
+# Author      : Akshat Jain
+# Roll Number : M25CSA003
+# Description : Asynchronous chat server for the Reggy++ chatbot in
+#               M25CSA003_prob1.py
+#               - One ReggySession per TCP connection, thousands of
+#                 concurrent sessions in one process
+#               - Line-delimited JSON: the client sends {"cmd": "start"} for
+#                 the greeting, then one {"text": ...} per answer; the server
+#                 replies to each with {"reply": [lines], "done": bool}
+#               - Per-turn latency percentiles and active-session gauges via
+#                 {"cmd": "stats"}
+#               - Built-in load generator that plays many users at once
+# Usage       : python M25CSA003_prob1_server.py serve [--port 8766]
+#               python M25CSA003_prob1_server.py loadgen [--port 8766]
+#                   [--sessions 2000] [--think-ms 0]
+# ==============================================================================
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from collections import deque
+
+from M25CSA003_prob1 import ReggySession
+
+LATENCY_WINDOW = 100000  # most recent turn latencies kept for percentiles
+
+# ------------------------------------------------------------------------------
+# Function: percentile
+# Description: Nearest-rank percentile of an already sorted list.
+# ------------------------------------------------------------------------------
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+# ------------------------------------------------------------------------------
+# Class: ChatStats
+# Description: Session gauges (active now, peak) and counters, plus a sliding
+#              window of per-turn latencies (request line read -> reply
+#              written), measured inside the server.
+# ------------------------------------------------------------------------------
+class ChatStats:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.active = 0
+        self.peak_active = 0
+        self.sessions_started = 0
+        self.sessions_completed = 0
+        self.turns = 0
+        self.errors = 0
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+
+    def open_session(self):
+        self.active += 1
+        self.sessions_started += 1
+        self.peak_active = max(self.peak_active, self.active)
+
+    def close_session(self, completed):
+        self.active -= 1
+        if completed:
+            self.sessions_completed += 1
+
+    def record_turn(self, seconds):
+        self.turns += 1
+        self.latencies.append(seconds)
+
+    def snapshot(self):
+        elapsed = time.perf_counter() - self.started
+        ordered = sorted(self.latencies)
+        return {
+            "active_sessions": self.active,
+            "peak_active_sessions": self.peak_active,
+            "sessions_started": self.sessions_started,
+            "sessions_completed": self.sessions_completed,
+            "turns": self.turns,
+            "errors": self.errors,
+            "uptime_s": elapsed,
+            "turns_per_s": self.turns / elapsed if elapsed else 0.0,
+            "turn_p50_ms": percentile(ordered, 50) * 1000,
+            "turn_p99_ms": percentile(ordered, 99) * 1000,
+        }
+
+def send(writer, message):
+    writer.write((json.dumps(message) + "\n").encode("utf-8"))
+
+# ------------------------------------------------------------------------------
+# Function: handle_client
+# Description: One task per connection. A connection whose first message is
+#              {"cmd": "stats"} just gets the counters; otherwise it is a chat
+#              session that gets Reggy's opening lines straight away and is
+#              closed after the goodbye.
+# ------------------------------------------------------------------------------
+async def handle_client(stats, reader, writer):
+    session = None
+    try:
+        while session is None or not session.done:
+            line = await reader.readline()
+            if not line:
+                break
+            start = time.perf_counter()
+            try:
+                message = json.loads(line)
+                if not isinstance(message, dict):
+                    raise ValueError("message must be a JSON object")
+            except ValueError as exc:
+                stats.errors += 1
+                send(writer, {"error": f"bad message: {exc}"})
+                continue
+
+            if message.get("cmd") == "stats":
+                send(writer, stats.snapshot())
+                await writer.drain()
+                if session is None:
+                    break
+                continue
+
+            if session is None:
+                session = ReggySession()
+                stats.open_session()
+                opening = session.start()
+            else:
+                opening = []
+            if message.get("cmd") == "start":
+                send(writer, {"reply": opening, "done": False})
+            else:
+                reply = opening + session.reply(str(message.get("text", "")))
+                send(writer, {"reply": reply, "done": session.done})
+            stats.record_turn(time.perf_counter() - start)
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        if session is not None:
+            stats.close_session(session.done)
+        writer.close()
+
+async def serve(host, port):
+    stats = ChatStats()
+    server = await asyncio.start_server(
+        lambda r, w: handle_client(stats, r, w), host, port, backlog=4096)
+    print(f"Reggy chat server on {host}:{port}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        print(json.dumps(stats.snapshot(), indent=1))
+
+# ------------------------------------------------------------------------------
+# Load generator
+# Description: Opens `sessions` connections at once; each plays one user
+#              through the whole dialog (start, name, DOB, mood) with an
+#              optional think time between turns. Prints client-side turn
+#              latency, session throughput and the server's gauges.
+# ------------------------------------------------------------------------------
+NAMES = ["Akshat Jain", "Mary Ann O'Neil", "Ravi", "Dr. Sunita Rao", "x"]
+DOBS = ["15th Jan 2000", "2000-01-15", "25/09/1999", "jan 3rd, 98", "2509-01", "no idea"]
+MOODS = ["I am so happy!", "feeling low today", "kinda angry", "omg wow", "meh", "scared"]
+
+async def _user(host, port, think, latencies, rnd):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        turns = [{"cmd": "start"}, {"text": rnd.choice(NAMES)},
+                 {"text": rnd.choice(DOBS)}, {"text": rnd.choice(MOODS)}]
+        for message in turns:
+            if think:
+                await asyncio.sleep(rnd.uniform(0, 2 * think))
+            start = time.perf_counter()
+            send(writer, message)
+            await writer.drain()
+            response = json.loads(await reader.readline())
+            latencies.append(time.perf_counter() - start)
+            if "reply" not in response:
+                raise RuntimeError(f"server error: {response}")
+        if not response["done"]:
+            raise RuntimeError("dialog did not finish after three answers")
+    finally:
+        writer.close()
+
+async def _server_stats(host, port):
+    reader, writer = await asyncio.open_connection(host, port)
+    send(writer, {"cmd": "stats"})
+    await writer.drain()
+    stats = json.loads(await reader.readline())
+    writer.close()
+    return stats
+
+async def loadgen(host, port, sessions, think, seed=0):
+    rnd = random.Random(seed)
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(_user(host, port, think, latencies, random.Random(rnd.random()))
+                           for _ in range(sessions)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+
+    stats = await _server_stats(host, port)
+    print(f"\n--- Load Test: {sessions} concurrent sessions ---")
+    print(f"Wall time          : {elapsed:.2f} s ({sessions / elapsed:,.0f} sessions/sec, "
+          f"{len(latencies) / elapsed:,.0f} turns/sec)")
+    print(f"Client turn p50    : {percentile(latencies, 50) * 1000:.2f} ms")
+    print(f"Client turn p99    : {percentile(latencies, 99) * 1000:.2f} ms")
+    print(f"Server turn p50    : {stats['turn_p50_ms']:.3f} ms")
+    print(f"Server turn p99    : {stats['turn_p99_ms']:.3f} ms")
+    print(f"Peak active        : {stats['peak_active_sessions']} sessions")
+    print(f"Completed sessions : {stats['sessions_completed']} / {stats['sessions_started']}")
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Reggy++ concurrent chat server")
+    sub = parser.add_subparsers(dest="mode", required=True)
+
+    server = sub.add_parser("serve", help="run the chat server")
+    server.add_argument("--host", default="127.0.0.1")
+    server.add_argument("--port", type=int, default=8766)
+
+    client = sub.add_parser("loadgen", help="simulate many concurrent users")
+    client.add_argument("--host", default="127.0.0.1")
+    client.add_argument("--port", type=int, default=8766)
+    client.add_argument("--sessions", type=int, default=2000)
+    client.add_argument("--think-ms", type=float, default=0.0,
+                        help="mean pause between a user's turns")
+    client.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+def main():
+    args = parse_args(sys.argv[1:])
+    try:
+        if args.mode == "loadgen":
+            asyncio.run(loadgen(args.host, args.port, args.sessions, args.think_ms / 1000, args.seed))
+        else:
+            asyncio.run(serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print("\nShutting down...")
+
+if __name__ == "__main__":
+    main()
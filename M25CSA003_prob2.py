@@ -6,87 +6,686 @@
 # Usage       : python M25CSA003_prob2.py <k> <corpus_file>
 # ==============================================================================
 
+import argparse
+import mmap
+import multiprocessing
+import os
 import sys
+import time
+import tracemalloc
 import collections
+import functools
+import gc
+import heapq
 import re
+import struct
+from array import array
+
+# str.split() jin ASCII bytes pe split karta hai; chunk boundaries sirf inhi pe
+# kaat-te hain, taaki koi word do chunks mein na toote (UTF-8 multibyte sequences
+# mein ASCII bytes kabhi nahi aate).
+WHITESPACE_RE = re.compile(rb"[ \t\n\r\x0b\x0c\x1c-\x1f]")
+CHUNK_SIZE = 8 * 1024 * 1024
+
+def chunk_bounds(mm, chunk_size=CHUNK_SIZE):
+    """Buffer ko ~chunk_size ke (start, end) pieces mein todta hai, whitespace pe."""
+    bounds = []
+    start, size = 0, len(mm)
+    while start < size:
+        end = min(start + chunk_size, size)
+        if end < size:
+            match = WHITESPACE_RE.search(mm, end)
+            end = match.end() if match else size
+        bounds.append((start, end))
+        start = end
+    return bounds
+
+def _count_chunk(task):
+    """Worker: file ke ek byte range ke words count karta hai."""
+    path, start, end = task
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return collections.Counter(mm[start:end].decode('utf-8').split())
+
+def count_words(path, workers=None, chunk_size=CHUNK_SIZE):
+    """
+    Corpus ko memory map karke chunk-by-chunk words count karta hai.
+
+    Ek time pe sirf ek chunk (per worker) decode hota hai, isliye memory
+    chunk_size aur unique words pe bounded hai, corpus size pe nahi. Per-shard
+    Counters file order mein merge hote hain, isliye result ka key order wahi
+    hai jo text.split() pe counting se milta (first occurrence order).
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return collections.Counter()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            bounds = chunk_bounds(mm, chunk_size)
+
+    tasks = [(path, start, end) for start, end in bounds]
+    workers = min(workers or os.cpu_count() or 1, len(tasks))
+    word_counts = collections.Counter()
+    if workers <= 1:
+        for task in tasks:
+            word_counts.update(_count_chunk(task))
+    else:
+        with multiprocessing.Pool(workers) as pool:
+            for shard in pool.imap(_count_chunk, tasks):
+                word_counts.update(shard)
+    return word_counts
 
 def get_stats(ids, counts):
     """Pair frequencies calculate karta hai."""
     pair_counts = collections.defaultdict(int)
-    for word_ids, freq in counts.items():
+    for word_ids, freq in ids.items():
         for i in range(len(word_ids) - 1):
             pair = (word_ids[i], word_ids[i+1])
             pair_counts[pair] += freq
     return pair_counts
 
+def merge_word(word_ids, pair, idx):
+    """Ek word ke andar pair ke saare (left-to-right) occurrences replace karta hai."""
+    new_word_ids = []
+    i = 0
+    while i < len(word_ids):
+        if i < len(word_ids) - 1 and (word_ids[i], word_ids[i+1]) == pair:
+            new_word_ids.append(idx)
+            i += 2
+        else:
+            new_word_ids.append(word_ids[i])
+            i += 1
+    return tuple(new_word_ids)
+
 def merge(ids, pair, idx):
     """Sabse zyada aane wale pair ko naye ID se replace karta hai."""
     new_ids = {}
     for word_ids, freq in ids.items():
-        new_word_ids = []
-        i = 0
-        while i < len(word_ids):
-            if i < len(word_ids) - 1 and (word_ids[i], word_ids[i+1]) == pair:
-                new_word_ids.append(idx)
-                i += 2
-            else:
-                new_word_ids.append(word_ids[i])
-                i += 1
-        new_ids[tuple(new_word_ids)] = freq
+        new_ids[merge_word(word_ids, pair, idx)] = freq
     return new_ids
 
-def main():
-    # Command line arguments check (python script.py k corpus.txt)
-    if len(sys.argv) != 3:
-        print("Usage: python M25CSA003_prob2.py <num_merges_k> <corpus_file>")
-        sys.exit(1)
+class NaiveBPETrainer:
+    """Reference trainer: har merge pe get_stats() + merge() poore table pe."""
+
+    def __init__(self, counts):
+        self.current_ids = dict(counts)
+
+    def step(self):
+        """Ek merge karta hai. Returns (pair, new_id, occurrences) ya None."""
+        stats = get_stats(self.current_ids, self.current_ids)
+        if not stats:
+            return None
+        best_pair = max(stats, key=stats.get)
+        new_id = f"{best_pair[0]}{best_pair[1]}"
+        self.current_ids = merge(self.current_ids, best_pair, new_id)
+        return best_pair, new_id, stats[best_pair]
+
+    def decode(self, symbol):
+        """Symbols pehle se strings hain."""
+        return symbol
+
+    def word_table(self):
+        return self.current_ids
+
+class IncrementalBPETrainer:
+    """
+    get_stats/merge loop ka incremental version.
+
+    Pair counts aur pair -> words index merges ke beech maintain hote hain, aur
+    har merge sirf un words ko touch karta hai jinme best pair hai. Best pair
+    ek heap se aata hai (lazy invalidation: stale entries pop hone pe skip).
+
+    Tie-breaking NaiveBPETrainer jaisa hi hai: max(stats, key=stats.get) us pair
+    ko chunta hai jo word table scan mein sabse pehle aata hai, isliye heap key
+    (-count, first word index, first char offset in that word) hai. Char offset
+    merges se change nahi hota, isliye same word ke pairs hamesha comparable hain.
+    """
+
+    def __init__(self, counts):
+        self._load(counts)
+        self.pair_counts = collections.defaultdict(int)
+        self.pair_words = collections.defaultdict(set)
+        self.first_seen = {}  # pair -> (word index, char offset)
+        self.heap = []
+
+        for w in range(len(self.freqs)):
+            for pair, (n, offset) in self._pair_layout(self._word(w)).items():
+                self.pair_counts[pair] += n * self.freqs[w]
+                self.pair_words[pair].add(w)
+                if pair not in self.first_seen:
+                    self.first_seen[pair] = (w, offset)
+
+        self.heap = [(-count, *self.first_seen[pair], pair)
+                     for pair, count in self.pair_counts.items()]
+        heapq.heapify(self.heap)
+
+    # --- Word storage hooks (CompactBPETrainer inhe override karta hai) ---
+    def _load(self, counts):
+        self.words = [tuple(word_ids) for word_ids in counts]
+        self.freqs = list(counts.values())
+
+    def _word(self, w):
+        return self.words[w]
+
+    def _set_word(self, w, word_ids):
+        self.words[w] = word_ids
+
+    def _symbol_len(self, symbol):
+        return len(symbol)
+
+    def _new_symbol(self, pair):
+        return f"{pair[0]}{pair[1]}"
+
+    def _pair_layout(self, word_ids):
+        """pair -> (occurrences, first char offset) for one word, scan order mein."""
+        layout = {}
+        offset = 0
+        for i in range(len(word_ids) - 1):
+            pair = (word_ids[i], word_ids[i+1])
+            seen = layout.get(pair)
+            if seen is None:
+                layout[pair] = (1, offset)
+            else:
+                layout[pair] = (seen[0] + 1, seen[1])
+            offset += self._symbol_len(word_ids[i])
+        return layout
+
+    def _pop_best(self):
+        while self.heap:
+            neg_count, w, offset, pair = heapq.heappop(self.heap)
+            if self.pair_counts.get(pair) == -neg_count and self.first_seen.get(pair) == (w, offset):
+                return pair, -neg_count
+        return None
+
+    def step(self):
+        """Ek merge karta hai. Returns (pair, new_id, occurrences) ya None."""
+        best = self._pop_best()
+        if best is None:
+            return None
+        best_pair, occurrences = best
+        new_id = self._new_symbol(best_pair)
+
+        # Sirf affected words update karo, aur unke pair counts ka diff lagao
+        layouts = {}     # modified word -> new layout
+        present = collections.defaultdict(list)  # pair -> modified words that still have it
+        dirty = set()
+        for w in self.pair_words.pop(best_pair):
+            freq = self.freqs[w]
+            word_ids = self._word(w)
+            before = self._pair_layout(word_ids)
+            word_ids = merge_word(word_ids, best_pair, new_id)
+            self._set_word(w, word_ids)
+            after = self._pair_layout(word_ids)
+            layouts[w] = after
+
+            for pair, (n, _) in before.items():
+                if pair not in after:
+                    self.pair_counts[pair] -= n * freq
+                    self.pair_words[pair].discard(w)
+                    dirty.add(pair)
+            for pair, (n, offset) in after.items():
+                present[pair].append(w)
+                old = before.get(pair)
+                if old is None:
+                    self.pair_counts[pair] += n * freq
+                    self.pair_words[pair].add(w)
+                    dirty.add(pair)
+                elif old != (n, offset):
+                    self.pair_counts[pair] += (n - old[0]) * freq
+                    dirty.add(pair)
+
+        del self.pair_counts[best_pair]
+        del self.first_seen[best_pair]
+        dirty.discard(best_pair)
+
+        for pair in dirty:
+            if self.pair_counts[pair] == 0:
+                del self.pair_counts[pair]
+                del self.pair_words[pair]
+                del self.first_seen[pair]
+                continue
+            # First word sirf tab full scan se dhundo jab purana first word pair kho de
+            old_first = self.first_seen.get(pair)
+            if old_first is not None and old_first[0] in self.pair_words[pair]:
+                first = min([old_first[0], *present[pair]])
+            else:
+                first = min(self.pair_words[pair])
+            if first in layouts:
+                offset = layouts[first][pair][1]
+            elif old_first is not None and first == old_first[0]:
+                offset = old_first[1]
+            else:
+                offset = self._pair_layout(self._word(first))[pair][1]
+            self.first_seen[pair] = (first, offset)
+            heapq.heappush(self.heap, (-self.pair_counts[pair], first, offset, pair))
+
+        return best_pair, new_id, occurrences
+
+    def decode(self, symbol):
+        """Symbol ko printable string mein convert karta hai."""
+        return symbol
+
+    def word_table(self):
+        return dict(zip(self.words, self.freqs))
+
+class CompactCorpus:
+    """
+    Word table ka flat-buffer form.
+
+    Symbols small integers hain, aur side table `symbols` ID -> bytes map karta
+    hai. Saare words ek hi array('I') mein packed hain; word w ke IDs
+    buf[starts[w] : starts[w] + lengths[w]] pe hain. Merge ke baad word chhota
+    hota hai, isliye use apni hi jagah pe likh dete hain (buffer kabhi grow
+    nahi hota).
+    """
+
+    def __init__(self):
+        self.symbols = []      # id -> bytes
+        self.symbol_ids = {}   # bytes -> id
+        self.buf = array('I')
+        self.starts = array('Q')
+        self.lengths = array('I')
+        self.freqs = array('Q')
+
+    @classmethod
+    def from_counts(cls, counts):
+        """counts: word (str ya chars ka tuple) -> freq."""
+        corpus = cls()
+        for word, freq in counts.items():
+            corpus.starts.append(len(corpus.buf))
+            corpus.lengths.append(len(word))
+            corpus.freqs.append(freq)
+            corpus.buf.extend(corpus.intern(ch.encode('utf-8')) for ch in word)
+        return corpus
+
+    def intern(self, symbol_bytes):
+        """Bytes ke liye ID return karta hai, zarurat ho to naya ID banata hai."""
+        sym_id = self.symbol_ids.get(symbol_bytes)
+        if sym_id is None:
+            sym_id = len(self.symbols)
+            self.symbols.append(symbol_bytes)
+            self.symbol_ids[symbol_bytes] = sym_id
+        return sym_id
+
+    def __len__(self):
+        return len(self.freqs)
+
+    def word(self, w):
+        start = self.starts[w]
+        return self.buf[start:start + self.lengths[w]]
+
+    def set_word(self, w, word_ids):
+        start = self.starts[w]
+        self.buf[start:start + len(word_ids)] = array('I', word_ids)
+        self.lengths[w] = len(word_ids)
 
+    def decode(self, sym_id):
+        return self.symbols[sym_id].decode('utf-8')
+
+    def word_table(self):
+        """Same shape as merge() output: tuple of token strings -> freq."""
+        return {tuple(self.decode(s) for s in self.word(w)): self.freqs[w]
+                for w in range(len(self))}
+
+class CompactBPETrainer(IncrementalBPETrainer):
+    """
+    IncrementalBPETrainer, lekin words CompactCorpus mein integer IDs ke roop mein.
+
+    Naya symbol concatenated bytes se intern hota hai, isliye 'ab'+'c' aur
+    'a'+'bc' ko same ID milta hai, bilkul string mode ki tarah; merge sequence
+    dono modes mein same rehta hai.
+    """
+
+    def _load(self, counts):
+        self.corpus = CompactCorpus.from_counts(counts)
+        self.freqs = self.corpus.freqs
+
+    def _word(self, w):
+        return self.corpus.word(w)
+
+    def _set_word(self, w, word_ids):
+        self.corpus.set_word(w, word_ids)
+
+    def _symbol_len(self, symbol):
+        return len(self.corpus.symbols[symbol])
+
+    def _new_symbol(self, pair):
+        symbols = self.corpus.symbols
+        return self.corpus.intern(symbols[pair[0]] + symbols[pair[1]])
+
+    def decode(self, symbol):
+        return self.corpus.decode(symbol)
+
+    def word_table(self):
+        return self.corpus.word_table()
+
+# Binary model layout (little-endian, sab fields 4-byte aligned, mmap-friendly):
+#   header  : magic, vocab_size, alphabet_size, num_merges, blob_len
+#   offsets : uint32[vocab_size + 1]   token i = blob[offsets[i]:offsets[i+1] - 1]
+#   merges  : uint32[num_merges * 3]   (left id, right id, new id) rank order mein
+#   blob    : saare tokens ke UTF-8 bytes, "\n" se separated (tokens mein
+#             whitespace nahi hota, isliye poora vocab ek split() se decode hota hai)
+MODEL_MAGIC = b"BPE\x01"
+MODEL_HEADER = struct.Struct("<4sIIII")
+TEXT_MAGIC = "#version: bpe-text 1"
+
+class BPETokenizer:
+    """
+    Learned merges se naya text tokenize karta hai (encode/decode).
+
+    Har word pe merges rank order mein lagte hain: baar baar sabse kam rank
+    wala adjacent pair merge hota hai, jo training ke sequential merges jaisa
+    hi segmentation deta hai. Natural text mein words bahut repeat hote hain,
+    isliye per-word encodings ek bounded LRU cache mein rehti hain.
+
+    Vocabulary: id 0 = <unk> (alphabet ke bahar ke characters), id 1 = word
+    separator " ", phir sorted alphabet, phir merged tokens merge order mein.
+    """
+
+    UNK = "<unk>"
+    SPACE = " "
+
+    def __init__(self, merges, alphabet, cache_size=65536):
+        vocab = [self.UNK, self.SPACE] + sorted(alphabet)
+        token_ids = {token: i for i, token in enumerate(vocab)}
+        merge_ids = array('I')  # flat (left id, right id, new id) triples
+        for (left, right), new_id in merges.items():
+            if new_id not in token_ids:
+                token_ids[new_id] = len(vocab)
+                vocab.append(new_id)
+            merge_ids.extend((token_ids[left], token_ids[right], token_ids[new_id]))
+        self._init_tables(vocab, len(alphabet), merge_ids, cache_size)
+
+    def _init_tables(self, vocab, alphabet_size, merge_ids, cache_size):
+        self.vocab = vocab
+        self.alphabet_size = alphabet_size
+        self.merge_ids = merge_ids
+        self.merge_new = merge_ids[2::3]
+        self.num_merges = len(self.merge_new)
+        self.char_ids = {vocab[i]: i for i in range(2, 2 + alphabet_size)}
+        # (left id, right id) -> rank; reversed build taaki repeated pair ka sabse
+        # pehla rank jeete
+        self.ranks = dict(zip(zip(reversed(merge_ids[0::3]), reversed(merge_ids[1::3])),
+                              range(self.num_merges - 1, -1, -1)))
+        self.unk_id = 0
+        self.space_id = 1
+        self._encode_word = functools.lru_cache(maxsize=cache_size)(self._merge_word)
+
+    def _merge_word(self, word):
+        parts = tuple(self.char_ids.get(ch, self.unk_id) for ch in word)
+        while len(parts) > 1:
+            # Sabse kam rank wala pair dhundo
+            best_pair, best_rank = None, None
+            for pair in zip(parts, parts[1:]):
+                rank = self.ranks.get(pair)
+                if rank is not None and (best_rank is None or rank < best_rank):
+                    best_pair, best_rank = pair, rank
+            if best_pair is None:
+                break
+            parts = merge_word(parts, best_pair, self.merge_new[best_rank])
+        return parts
+
+    def encode(self, text):
+        """Text -> token ids. Words (text.split()) ke beech space id aata hai."""
+        ids = []
+        for i, word in enumerate(text.split()):
+            if i:
+                ids.append(self.space_id)
+            ids.extend(self._encode_word(word))
+        return ids
+
+    def encode_many(self, lines):
+        return [self.encode(line) for line in lines]
+
+    def decode(self, ids):
+        return "".join(self.vocab[i] for i in ids)
+
+    def cache_info(self):
+        return self._encode_word.cache_info()
+
+    # --- Persistence ---
+    def save(self, path):
+        """Binary (mmap-able) model likhta hai; layout MODEL_HEADER ke upar documented hai."""
+        blob = "\n".join(self.vocab).encode('utf-8')
+        offsets = array('I', [0])
+        for token in self.vocab:
+            offsets.append(offsets[-1] + len(token.encode('utf-8')) + 1)
+        merges = array('I', self.merge_ids)
+        if sys.byteorder != 'little':
+            offsets.byteswap()
+            merges.byteswap()
+        with open(path, 'wb') as f:
+            f.write(MODEL_HEADER.pack(MODEL_MAGIC, len(self.vocab), self.alphabet_size,
+                                      self.num_merges, len(blob)))
+            f.write(offsets.tobytes())
+            f.write(merges.tobytes())
+            f.write(blob)
+
+    @classmethod
+    def load(cls, path, cache_size=65536):
+        """save() ka output memory map karke tokenizer banata hai (koi parsing/retraining nahi)."""
+        # Hazaron chhote tuples bante hain; load ke dauran GC passes sirf time khaate hain
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return cls._load_mmap(path, cache_size)
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    @classmethod
+    def _load_mmap(cls, path, cache_size):
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            magic, vocab_size, alphabet_size, num_merges, blob_len = MODEL_HEADER.unpack_from(mm, 0)
+            if magic != MODEL_MAGIC:
+                raise ValueError(f"'{path}' is not a BPE model file")
+            pos = MODEL_HEADER.size
+            merges_pos = pos + 4 * (vocab_size + 1)
+            blob_pos = merges_pos + 12 * num_merges
+            with memoryview(mm) as view:
+                merge_ids = array('I')
+                merge_ids.frombytes(view[merges_pos:blob_pos])
+                vocab = str(view[blob_pos:blob_pos + blob_len], 'utf-8').split("\n")
+        if sys.byteorder != 'little':
+            merge_ids.byteswap()
+        tokenizer = cls.__new__(cls)
+        tokenizer._init_tables(vocab, alphabet_size, merge_ids, cache_size)
+        return tokenizer
+
+    def save_text(self, path):
+        """Readable form (diff ke liye): alphabet line, phir har line pe ek merge 'left right'."""
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(TEXT_MAGIC + "\n")
+            f.write("#alphabet: " + " ".join(self.vocab[2:2 + self.alphabet_size]) + "\n")
+            for left, right in zip(self.merge_ids[0::3], self.merge_ids[1::3]):
+                f.write(f"{self.vocab[left]} {self.vocab[right]}\n")
+
+    @classmethod
+    def load_text(cls, path, cache_size=65536):
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.readline().rstrip("\n") != TEXT_MAGIC:
+                raise ValueError(f"'{path}' is not a BPE text model")
+            alphabet = f.readline().rstrip("\n").split(" ")[1:]
+            merges = {}
+            for line in f:
+                left, right = line.rstrip("\n").split(" ")
+                merges[(left, right)] = left + right
+        # Text form sorted alphabet likhta hai, isliye ids binary form jaise hi rehte hain
+        return cls(merges, alphabet, cache_size)
+
+def encode_report(tokenizer, path, batch_size=10000):
+    """File ko line batches mein encode karke throughput aur cache hit rate print karta hai."""
+    num_lines = num_tokens = 0
+    start = time.perf_counter()
+    with open(path, 'r', encoding='utf-8') as f:
+        while True:
+            batch = [line for _, line in zip(range(batch_size), f)]
+            if not batch:
+                break
+            for ids in tokenizer.encode_many(batch):
+                num_tokens += len(ids)
+            num_lines += len(batch)
+    elapsed = time.perf_counter() - start
+
+    info = tokenizer.cache_info()
+    lookups = info.hits + info.misses
+    print(f"\n--- Encode Report ({path}) ---")
+    print(f"Lines encoded   : {num_lines}")
+    print(f"Tokens produced : {num_tokens}")
+    print(f"Throughput      : {num_tokens / elapsed if elapsed else 0:,.0f} tokens/sec")
+    print(f"Word cache      : {info.hits}/{lookups} hits "
+          f"({info.hits / lookups * 100 if lookups else 0:.2f}%), size {info.currsize}/{info.maxsize}")
+
+def run_encode_report(tokenizer, path):
     try:
-        k = int(sys.argv[1]) # Pehla argument: k
-        corpus_path = sys.argv[2] # Dusra argument: corpus.txt
-    except ValueError:
-        print("Error: 'k' must be an integer.")
+        encode_report(tokenizer, path)
+    except FileNotFoundError:
+        print(f"Error: File '{path}' not found.")
         sys.exit(1)
 
-    # 1. Load Corpus
+def _traced(build):
+    """build() ko tracemalloc ke andar chalata hai. Returns (result, current, peak) bytes."""
+    tracemalloc.start()
     try:
-        with open(corpus_path, 'r', encoding='utf-8') as f:
-            text = f.read()
+        result = build()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, current, peak
+
+def memory_report(counts, k):
+    """Tuple-of-str aur int-ID flat buffer representations ki memory compare karta hai."""
+    words = ["".join(word_ids) for word_ids in counts]
+    freqs = list(counts.values())
+
+    def run(trainer_cls, table):
+        trainer = trainer_cls(table)
+        for _ in range(k):
+            if trainer.step() is None:
+                break
+        return trainer
+
+    def tuple_table():
+        return {tuple(w): f for w, f in zip(words, freqs)}
+
+    def str_table():
+        return dict(zip(words, freqs))
+
+    # (name, word table builder, trainer input builder, trainer class)
+    rows = [
+        ("tuple-of-str", tuple_table, tuple_table, IncrementalBPETrainer),
+        ("int-ID flat buffer", lambda: CompactCorpus.from_counts(str_table()),
+         str_table, CompactBPETrainer),
+    ]
+    print(f"--- Memory Report ({len(words)} unique words, {k} merges) ---")
+    print(f"{'Representation':<20} | {'Word table':>12} | {'Trainer (current)':>18} | {'Trainer (peak)':>15}")
+    print("-" * 75)
+    for name, build_table, build_input, trainer_cls in rows:
+        table, table_bytes, _ = _traced(build_table)
+        del table
+        trainer, current, peak = _traced(lambda: run(trainer_cls, build_input()))
+        del trainer
+        print(f"{name:<20} | {table_bytes / 1e6:>9.2f} MB | {current / 1e6:>15.2f} MB | {peak / 1e6:>12.2f} MB")
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        usage="python M25CSA003_prob2.py <num_merges_k> <corpus_file> [options]")
+    parser.add_argument("k", type=int, nargs="?", help="number of merges")
+    parser.add_argument("corpus_file", nargs="?")
+    parser.add_argument("--naive", action="store_true",
+                        help="use the reference get_stats/merge loop (full recount per merge)")
+    parser.add_argument("--compact", action="store_true",
+                        help="train on integer symbol IDs with a flat array('I') word buffer")
+    parser.add_argument("--memory-report", action="store_true",
+                        help="compare memory of the tuple-of-str and int-ID representations")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="processes for word counting (default: all cores)")
+    parser.add_argument("--chunk-mb", type=int, default=CHUNK_SIZE // (1024 * 1024),
+                        help="corpus chunk size in MB for streaming ingestion")
+    parser.add_argument("--encode", metavar="FILE",
+                        help="after training, encode FILE and report tokens/sec and cache hit rate")
+    parser.add_argument("--cache-size", type=int, default=65536,
+                        help="LRU word cache size for encoding")
+    parser.add_argument("--save", metavar="PATH",
+                        help="save the trained model to PATH (binary) and PATH.txt (text)")
+    parser.add_argument("--model", metavar="PATH",
+                        help="load a saved model (binary, or text if it ends in .txt) instead of training")
+    args = parser.parse_args(argv)
+    if args.model is None and (args.k is None or args.corpus_file is None):
+        parser.error("<num_merges_k> and <corpus_file> are required unless --model is given")
+    return args
+
+def load_model(path, cache_size=65536):
+    """Saved model load karta hai; '.txt' wale path ko text form maana jaata hai."""
+    if path.endswith(".txt"):
+        return BPETokenizer.load_text(path, cache_size)
+    return BPETokenizer.load(path, cache_size)
+
+def main():
+    # Command line arguments (python script.py k corpus.txt [--naive])
+    args = parse_args(sys.argv[1:])
+
+    # Saved model ho to retrain karne ki zarurat nahi
+    if args.model:
+        start = time.perf_counter()
+        try:
+            tokenizer = load_model(args.model, args.cache_size)
+        except FileNotFoundError:
+            print(f"Error: File '{args.model}' not found.")
+            sys.exit(1)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f"Loaded model '{args.model}': {len(tokenizer.vocab)} tokens, "
+              f"{tokenizer.num_merges} merges in {elapsed_ms:.2f} ms")
+        if args.encode:
+            run_encode_report(tokenizer, args.encode)
+        return
+
+    k = args.k # Pehla argument: k
+    corpus_path = args.corpus_file # Dusra argument: corpus.txt
+
+    # 1. Load Corpus (streaming, multi-process word counting)
+    try:
+        word_counts = count_words(corpus_path, args.workers, args.chunk_mb * 1024 * 1024)
     except FileNotFoundError:
         print(f"Error: File '{corpus_path}' not found.")
         sys.exit(1)
 
     # 2. Initialize Vocabulary (Characters + Frequency)
-    words = text.split()
-    # Word ko characters mein split karke tuple banana
-    counts = collections.defaultdict(int)
-    for word in words:
-        # Preprocessing: character split
-        ids = tuple(list(word))
-        counts[ids] += 1
+    # Word ko characters mein split karke tuple banana (compact mode str keys directly leta hai)
+    if args.compact:
+        counts = word_counts
+    else:
+        counts = {tuple(word): n for word, n in word_counts.items()}
 
     print(f"Initial Vocabulary Size (Unique words): {len(counts)}")
     print(f"Performing {k} merges...\n")
 
+    if args.memory_report:
+        memory_report(counts, k)
+        return
+
     # 3. BPE Training (k merges)
     merges = {} # (p1, p2) -> new_id
-    current_ids = counts
+    if args.naive:
+        trainer = NaiveBPETrainer(counts)
+    elif args.compact:
+        trainer = CompactBPETrainer(counts)
+    else:
+        trainer = IncrementalBPETrainer(counts)
 
     for i in range(k):
-        stats = get_stats(current_ids, counts)
-        if not stats:
+        result = trainer.step()
+        if result is None:
             break
-        
-        # Best pair find karo
-        best_pair = max(stats, key=stats.get)
-        new_id = f"{best_pair[0]}{best_pair[1]}" # String representation for clarity
-        
-        current_ids = merge(current_ids, best_pair, new_id)
+
+        # Compact mode mein IDs ko wapas strings mein decode karo
+        pair, new_id, occurrences = result
+        best_pair = (trainer.decode(pair[0]), trainer.decode(pair[1]))
+        new_id = trainer.decode(new_id)
         merges[best_pair] = new_id
-        
-        print(f"Merge {i+1}: {best_pair} -> {new_id} (Occurrences: {stats[best_pair]})")
+
+        print(f"Merge {i+1}: {best_pair} -> {new_id} (Occurrences: {occurrences})")
 
     # 4. Final Output
+    current_ids = trainer.word_table()
     print("\n--- Final BPE Vocabulary (Sample) ---")
     unique_tokens = set()
     for word_ids in current_ids.keys():
@@ -96,5 +695,16 @@ def main():
     print(f"Number of unique tokens after {k} merges: {len(unique_tokens)}")
     print("Sample Tokens:", list(unique_tokens)[:20])
 
+    # 5. Optional: model save karo / naye text ko learned merges se encode karo
+    if args.encode or args.save:
+        alphabet = {ch for word in counts for ch in word}
+        tokenizer = BPETokenizer(merges, alphabet, args.cache_size)
+        if args.save:
+            tokenizer.save(args.save)
+            tokenizer.save_text(args.save + ".txt")
+            print(f"\nModel saved to '{args.save}' and '{args.save}.txt'")
+        if args.encode:
+            run_encode_report(tokenizer, args.encode)
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,224 @@
+# ==============================================================================
+# File Name   : M25CSA003_prob2_bench.py
+# Author      : Akshat Jain
+# Roll Number : M25CSA003
+# Description : Benchmark + per-merge profiling harness for the BPE trainers
+#               in M25CSA003_prob2.py. Synthetic Zipfian corpora generate
+#               karta hai, har merge ka wall time aur peak memory record
+#               karta hai, aur results JSON mein likhta hai.
+# Usage       : python M25CSA003_prob2_bench.py [--tokens 100000,1000000]
+#                   [--vocab 5000,50000] [--zipf 1.0,1.2] [--ks 100,1000]
+#                   [--trainers naive,incremental,compact] [--out FILE]
+#                   [--baseline FILE --tolerance 1.5]
+# ==============================================================================
+
+import argparse
+import collections
+import json
+import platform
+import random
+import string
+import sys
+import time
+import tracemalloc
+
+from M25CSA003_prob2 import (NaiveBPETrainer, IncrementalBPETrainer, CompactBPETrainer,
+                             get_stats, merge)
+
+class TimedNaiveTrainer(NaiveBPETrainer):
+    """NaiveBPETrainer jo get_stats aur merge ka time alag alag record karta hai."""
+
+    def step(self):
+        start = time.perf_counter()
+        stats = get_stats(self.current_ids, self.current_ids)
+        self.last_split = {"get_stats_seconds": time.perf_counter() - start}
+        if not stats:
+            return None
+        best_pair = max(stats, key=stats.get)
+        new_id = f"{best_pair[0]}{best_pair[1]}"
+        start = time.perf_counter()
+        self.current_ids = merge(self.current_ids, best_pair, new_id)
+        self.last_split["merge_seconds"] = time.perf_counter() - start
+        return best_pair, new_id, stats[best_pair]
+
+TRAINERS = {
+    "naive": TimedNaiveTrainer,
+    "incremental": IncrementalBPETrainer,
+    "compact": CompactBPETrainer,
+}
+
+# ------------------------------------------------------------------------------
+# Synthetic corpus
+# ------------------------------------------------------------------------------
+def zipf_counts(num_tokens, vocab_size, zipf_s, alphabet_size=26, mean_len=6, seed=0):
+    """
+    Zipfian corpus ka word-count table (chars ka tuple -> freq), first
+    occurrence order mein, bilkul M25CSA003_prob2.main() ki tarah.
+    """
+    rnd = random.Random(seed)
+    alphabet = string.ascii_lowercase[:alphabet_size]
+    word_types = set()
+    while len(word_types) < vocab_size:
+        length = max(1, min(int(rnd.expovariate(1 / mean_len)) + 1, 4 * mean_len))
+        word_types.add("".join(rnd.choice(alphabet) for _ in range(length)))
+    word_types = sorted(word_types)
+    rnd.shuffle(word_types)
+
+    cum_weights = []
+    total = 0.0
+    for rank in range(1, vocab_size + 1):
+        total += 1.0 / rank ** zipf_s
+        cum_weights.append(total)
+
+    counts = collections.Counter(rnd.choices(word_types, cum_weights=cum_weights, k=num_tokens))
+    return {tuple(word): n for word, n in counts.items()}
+
+# ------------------------------------------------------------------------------
+# Measurement
+# ------------------------------------------------------------------------------
+def profile_training(trainer_cls, counts, max_k, trace_memory):
+    """max_k merges tak train karta hai; har merge ka time (aur peak memory) return karta hai."""
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    trainer = trainer_cls(counts)
+    init_seconds = time.perf_counter() - start
+    init_peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+
+    per_merge = []
+    for _ in range(max_k):
+        if trace_memory:
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        result = trainer.step()
+        seconds = time.perf_counter() - start
+        if result is None:
+            break
+        record = {"seconds": seconds, "occurrences": result[2]}
+        if trace_memory:
+            record["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        record.update(getattr(trainer, "last_split", {}))
+        per_merge.append(record)
+
+    if trace_memory:
+        tracemalloc.stop()
+    return init_seconds, init_peak, per_merge
+
+def summarize(init_seconds, per_merge, ks):
+    """Cumulative training time (init + pehle k merges) har requested k pe."""
+    checkpoints = []
+    for k in ks:
+        if k > len(per_merge):
+            continue
+        merges = per_merge[:k]
+        checkpoint = {"k": k, "seconds": init_seconds + sum(m["seconds"] for m in merges)}
+        if merges and "peak_bytes" in merges[0]:
+            checkpoint["peak_bytes"] = max(m["peak_bytes"] for m in merges)
+        checkpoints.append(checkpoint)
+    return checkpoints
+
+def run_key(run, k):
+    corpus = run["corpus"]
+    return (corpus["tokens"], corpus["vocab"], corpus["zipf"], run["trainer"], k)
+
+def compare_to_baseline(results, baseline, tolerance):
+    """Baseline se tolerance guna se zyada slow checkpoints return karta hai."""
+    old = {run_key(run, cp["k"]): cp["seconds"]
+           for run in baseline["runs"] for cp in run["checkpoints"]}
+    regressions = []
+    for run in results["runs"]:
+        for cp in run["checkpoints"]:
+            key = run_key(run, cp["k"])
+            if key in old and cp["seconds"] > old[key] * tolerance:
+                regressions.append((key, old[key], cp["seconds"]))
+    return regressions
+
+def parse_list(text, cast):
+    return [cast(part) for part in text.split(",") if part]
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the BPE trainers on synthetic Zipfian corpora.")
+    parser.add_argument("--tokens", default="100000,1000000", help="corpus sizes (running words)")
+    parser.add_argument("--vocab", default="5000,50000", help="number of distinct word types")
+    parser.add_argument("--zipf", default="1.0,1.2", help="Zipf exponents")
+    parser.add_argument("--alphabet", type=int, default=26, help="alphabet size")
+    parser.add_argument("--mean-len", type=int, default=6, help="mean word length")
+    parser.add_argument("--ks", default="100,500,1000", help="merge counts to report")
+    parser.add_argument("--trainers", default="naive,incremental,compact")
+    parser.add_argument("--naive-max-tokens", type=int, default=200000,
+                        help="skip the naive trainer on larger corpora")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="skip tracemalloc (faster, timings are less perturbed)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="bpe_bench.json", help="JSON results file")
+    parser.add_argument("--baseline", help="previous results file to compare against")
+    parser.add_argument("--tolerance", type=float, default=1.5,
+                        help="fail if a checkpoint is slower than baseline by this factor")
+    args = parser.parse_args()
+
+    ks = sorted(parse_list(args.ks, int))
+    trainers = parse_list(args.trainers, str)
+    for name in trainers:
+        if name not in TRAINERS:
+            parser.error(f"unknown trainer '{name}' (choose from {', '.join(TRAINERS)})")
+
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "seed": args.seed,
+            "memory_traced": not args.no_memory,
+        },
+        "runs": [],
+    }
+
+    print(f"{'tokens':>9} | {'vocab':>7} | {'zipf':>4} | {'trainer':<11} | {'k':>6} | {'seconds':>9} | {'peak MB':>8}")
+    print("-" * 72)
+    for num_tokens in parse_list(args.tokens, int):
+        for vocab_size in parse_list(args.vocab, int):
+            for zipf_s in parse_list(args.zipf, float):
+                counts = zipf_counts(num_tokens, vocab_size, zipf_s,
+                                     args.alphabet, args.mean_len, args.seed)
+                corpus = {"tokens": num_tokens, "vocab": vocab_size, "zipf": zipf_s,
+                          "alphabet": args.alphabet, "mean_len": args.mean_len,
+                          "unique_words": len(counts)}
+                for name in trainers:
+                    if name == "naive" and num_tokens > args.naive_max_tokens:
+                        continue
+                    init_seconds, init_peak, per_merge = profile_training(
+                        TRAINERS[name], counts, ks[-1], not args.no_memory)
+                    checkpoints = summarize(init_seconds, per_merge, ks)
+                    results["runs"].append({
+                        "corpus": corpus,
+                        "trainer": name,
+                        "init_seconds": init_seconds,
+                        "init_peak_bytes": init_peak,
+                        "merges_done": len(per_merge),
+                        "checkpoints": checkpoints,
+                        "per_merge": per_merge,
+                    })
+                    for cp in checkpoints:
+                        peak = f"{cp['peak_bytes'] / 1e6:8.2f}" if "peak_bytes" in cp else f"{'-':>8}"
+                        print(f"{num_tokens:>9} | {vocab_size:>7} | {zipf_s:>4} | {name:<11} | "
+                              f"{cp['k']:>6} | {cp['seconds']:>9.3f} | {peak}")
+
+    with open(args.out, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=1)
+    print(f"\nResults written to '{args.out}'")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline["meta"].get("memory_traced") != results["meta"]["memory_traced"]:
+            print("Warning: baseline and current run differ in --no-memory; timings are not comparable.")
+        regressions = compare_to_baseline(results, baseline, args.tolerance)
+        for (tokens, vocab, zipf_s, name, k), old, new in regressions:
+            print(f"REGRESSION: {name} tokens={tokens} vocab={vocab} zipf={zipf_s} k={k}: "
+                  f"{old:.3f}s -> {new:.3f}s")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions beyond {args.tolerance}x baseline.")
+
+if __name__ == "__main__":
+    main()
@@ -8,10 +8,29 @@
 #               - Provides interactive prediction
 # ==============================================================================
 
+import argparse
 import math
+import mmap
+import os
 import random
+import statistics
+import struct
 import sys
-from collections import defaultdict
+import time
+import tracemalloc
+import zlib
+from array import array
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice, repeat
+
+# NumPy/SciPy are optional: without them predict_batch falls back to predict()
+try:
+    import numpy as np
+    from scipy import sparse
+except ImportError:
+    np = None
+    sparse = None
 
 # ------------------------------------------------------------------------------
 # Preprocessing Configuration
@@ -23,6 +42,18 @@ STOP_WORDS = {
 }
 
 PUNCTUATION = '.,!?;:"()-'
+NEGATION_WORDS = frozenset(["not", "no", "never", "n't", "dont", "didnt", "wont"])
+
+# Maps every punctuation character to a space in one str.translate() pass
+PUNCTUATION_TABLE = str.maketrans(PUNCTUATION, ' ' * len(PUNCTUATION))
+
+# Lines per task when load_data() tokenizes in a process pool
+CHUNK_LINES = 10000
+
+# Saved model file: see NaiveBayesClassifier.save for the layout
+MODEL_MAGIC = b"NBC\x01"
+HASHED_MODEL_MAGIC = b"NBH\x01"  # same layout, buckets instead of vocab words
+MODEL_HEADER = struct.Struct("<4sIII")
 
 # ------------------------------------------------------------------------------
 # Function: preprocess_text
@@ -32,30 +63,19 @@ PUNCTUATION = '.,!?;:"()-'
 # Returns: list of strings (tokens)
 # ------------------------------------------------------------------------------
 def preprocess_text(raw_text):
-    # 1. Lowercase and remove punctuation
-    clean_text = raw_text.lower()
-    for char in PUNCTUATION:
-        clean_text = clean_text.replace(char, ' ')
-    
-    words = clean_text.split()
+    # 1. Lowercase and remove punctuation (single translate pass, no copy per char)
+    words = raw_text.lower().translate(PUNCTUATION_TABLE).split()
     tokens = []
     
-    skip_next = False
-    
-    for i in range(len(words)):
-        if skip_next:
-            skip_next = False
-            continue
-            
-        word = words[i]
-        
+    word_iter = iter(words)
+    for word in word_iter:
         # 2. Check for negation terms
-        if word in ["not", "no", "never", "n't", "dont", "didnt", "wont"]:
-            # If there is a next word, combine them (e.g., "not_good")
-            if i + 1 < len(words):
-                negated_word = "not_" + words[i+1]
-                tokens.append(negated_word)
-                skip_next = True # Skip the next word since we merged it
+        if word in NEGATION_WORDS:
+            # If there is a next word, combine them (e.g., "not_good");
+            # pulling it from the iterator skips it in the loop
+            next_word = next(word_iter, None)
+            if next_word is not None:
+                tokens.append("not_" + next_word)
             else:
                 tokens.append(word) # Keep 'not' if it's the last word
         
@@ -66,23 +86,108 @@ def preprocess_text(raw_text):
     return tokens
 
 # ------------------------------------------------------------------------------
-# Function: load_data
-# Description: Reads file and applies preprocessing.
+# Function: _tokenize_lines
+# Description: Worker for the process-pool mode of load_data. Applies the same
+#              filtering as the streaming path to one chunk of raw lines.
 # ------------------------------------------------------------------------------
-def load_data(filename, label):
+def _tokenize_lines(task):
+    lines, label = task
     data = []
+    for line in lines:
+        line = line.strip()
+        if line:
+            tokens = preprocess_text(line)
+            if tokens: # Only add if tokens exist after cleaning
+                data.append((tokens, label))
+    return data
+
+def _read_chunks(f, chunk_lines):
+    while True:
+        chunk = list(islice(f, chunk_lines))
+        if not chunk:
+            return
+        yield chunk
+
+# ------------------------------------------------------------------------------
+# Function: load_data
+# Description: Streams (tokens, label) pairs from a file, one line at a time.
+#              With workers > 1 the file is tokenized in chunks by a process
+#              pool; at most 2 chunks per worker are in flight, so memory stays
+#              bounded and the output order matches the file.
+# ------------------------------------------------------------------------------
+def load_data(filename, label, workers=1, chunk_lines=CHUNK_LINES):
     try:
         with open(filename, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    tokens = preprocess_text(line)
-                    if tokens: # Only add if tokens exist after cleaning
-                        data.append((tokens, label))
+            if workers <= 1:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        tokens = preprocess_text(line)
+                        if tokens: # Only add if tokens exist after cleaning
+                            yield tokens, label
+                return
+
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                pending = deque()
+                for chunk in _read_chunks(f, chunk_lines):
+                    pending.append(pool.submit(_tokenize_lines, (chunk, label)))
+                    if len(pending) >= 2 * workers:
+                        yield from pending.popleft().result()
+                while pending:
+                    yield from pending.popleft().result()
     except FileNotFoundError:
         print(f"Error: File '{filename}' not found.")
         sys.exit(1)
-    return data
+
+# ------------------------------------------------------------------------------
+# Function: _write_model_file / _read_model_file
+# Description: Shared file layout of NaiveBayesClassifier.save and
+#              HashedNaiveBayesClassifier.save (see the Persistence comment).
+#              `vocab_size` is the number of count rows per class: vocabulary
+#              words, or hash buckets for the hashed model (which stores no
+#              words, only labels).
+# ------------------------------------------------------------------------------
+def _write_model_file(path, magic, labels, vocab_size, class_doc_counts,
+                      class_total_words, counts, words=()):
+    for label in labels:
+        if not isinstance(label, str) or not label or any(ch.isspace() for ch in label):
+            raise ValueError(f"Cannot save label {label!r}: labels must be non-empty strings without whitespace")
+
+    doc_counts = array('Q', (class_doc_counts[label] for label in labels))
+    total_words = array('Q', (class_total_words[label] for label in labels))
+    blob = "\n".join(list(labels) + list(words)).encode('utf-8')
+
+    if sys.byteorder != 'little':
+        counts = array('I', counts)
+        for column in (doc_counts, total_words, counts):
+            column.byteswap()
+    with open(path, 'wb') as f:
+        f.write(MODEL_HEADER.pack(magic, len(labels), vocab_size, len(blob)))
+        f.write(doc_counts.tobytes())
+        f.write(total_words.tobytes())
+        f.write(counts.tobytes())
+        f.write(blob)
+
+def _read_model_file(path):
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        magic, num_classes, vocab_size, blob_len = MODEL_HEADER.unpack_from(mm, 0)
+        if magic not in (MODEL_MAGIC, HASHED_MODEL_MAGIC):
+            raise ValueError(f"'{path}' is not a Naive Bayes model file")
+
+        columns = []
+        pos = MODEL_HEADER.size
+        for typecode, length in (('Q', num_classes), ('Q', num_classes),
+                                 ('I', num_classes * vocab_size)):
+            column = array(typecode)
+            column.frombytes(mm[pos:pos + column.itemsize * length])
+            if sys.byteorder != 'little':
+                column.byteswap()
+            columns.append(column)
+            pos += column.itemsize * length
+        strings = mm[pos:pos + blob_len].decode('utf-8').split("\n") if blob_len else []
+
+    doc_counts, total_words, counts = columns
+    return magic, strings[:num_classes], vocab_size, doc_counts, total_words, counts, strings[num_classes:]
 
 # ------------------------------------------------------------------------------
 # Class: NaiveBayesClassifier
@@ -90,70 +195,592 @@ def load_data(filename, label):
 class NaiveBayesClassifier:
     def __init__(self):
         self.log_priors = {}        
-        self.word_counts = {}       
-        self.class_total_words = {} 
+        self.class_doc_counts = defaultdict(int)   # label -> number of documents
+        self.word_counts = defaultdict(Counter)    # label -> {word: count}
+        self.class_total_words = defaultdict(int)  # label -> number of tokens
         self.vocab = set()          
         self.classes = set()        
+        self.log_likelihoods = {}   # label -> {word: log P(word | label)}
+        self.unknown_log_probs = {} # label -> log P(unseen word | label)
+        self._batch_tables = None   # NumPy form of the tables, built on first predict_batch
+        self._stale = False         # counts changed since the tables were built
 
     def train(self, training_data):
-        class_doc_counts = defaultdict(int)
-        self.word_counts = defaultdict(lambda: defaultdict(int))
+        # Rebuild from scratch; partial_fit() adds to the existing counts
+        self.class_doc_counts = defaultdict(int)
+        self.word_counts = defaultdict(Counter)
         self.class_total_words = defaultdict(int)
-        
-        total_docs = len(training_data)
+        self.vocab = set()
+        self.classes = set()
+        self.partial_fit(training_data)
 
-        for tokens, label in training_data:
+    def partial_fit(self, batch):
+        """Add a batch of (tokens, label) pairs to the counts without replaying history."""
+        for tokens, label in batch:
             self.classes.add(label)
-            class_doc_counts[label] += 1
+            self.class_doc_counts[label] += 1
             
             for word in tokens:
                 self.vocab.add(word)
                 self.word_counts[label][word] += 1
                 self.class_total_words[label] += 1
 
-        # Calculate Log Priors
+        self._stale = True
+        return self
+
+    def merge(self, other):
+        """
+        Fold another model's counts into this one. Naive Bayes counts are
+        plain sums, so shards trained on disjoint data in separate processes
+        reduce to exactly the model trained on all of it.
+        """
+        for label in other.classes:
+            self.classes.add(label)
+            self.class_doc_counts[label] += other.class_doc_counts[label]
+            self.word_counts[label].update(other.word_counts[label])
+            self.class_total_words[label] += other.class_total_words[label]
+        self.vocab |= other.vocab
+
+        self._stale = True
+        return self
+
+    def subtract(self, other):
+        """
+        Remove counts previously added from `other` (the inverse of merge).
+        Words and classes whose counts drop to zero leave the vocabulary, so
+        "total minus one fold" is exactly the model trained without that fold.
+        """
+        touched = set()
+        for label in other.classes:
+            self.class_doc_counts[label] -= other.class_doc_counts[label]
+            self.class_total_words[label] -= other.class_total_words[label]
+            label_counts = self.word_counts[label]
+            for word, count in other.word_counts[label].items():
+                label_counts[word] -= count
+                if label_counts[word] <= 0:
+                    del label_counts[word]
+                    touched.add(word)
+            if self.class_doc_counts[label] <= 0:
+                self.classes.discard(label)
+                del self.class_doc_counts[label]
+                del self.class_total_words[label]
+                del self.word_counts[label]
+
+        for word in touched:
+            if not any(word in self.word_counts[label] for label in self.classes):
+                self.vocab.discard(word)
+
+        self._stale = True
+        return self
+
+    def copy(self):
+        return NaiveBayesClassifier().merge(self)
+
+    def _ensure_tables(self):
+        # Derived tables are only rebuilt when the model is queried after a change
+        if self._stale:
+            self._freeze()
+
+    def _freeze(self):
+        """
+        Compute log priors and Laplace-smoothed log-likelihoods from the counts.
+        Words never seen with a label all share that label's count-0 value,
+        so they are stored once per class instead of per word.
+        """
+        vocab_size = len(self.vocab)
+        total_docs = sum(self.class_doc_counts[label] for label in self.classes)
+        self.log_priors = {}
+        self.log_likelihoods = {}
+        self.unknown_log_probs = {}
+        self._batch_tables = None
+
         for label in self.classes:
-            prob = class_doc_counts[label] / total_docs
+            # Calculate Log Priors
+            prob = self.class_doc_counts[label] / total_docs
             self.log_priors[label] = math.log(prob)
 
+            denominator = self.class_total_words[label] + vocab_size
+            self.log_likelihoods[label] = {
+                word: math.log((count + 1) / denominator)
+                for word, count in self.word_counts[label].items()
+            }
+            # Unknown words get count 0
+            self.unknown_log_probs[label] = math.log(1 / denominator)
+
+        self._stale = False
+
     def predict(self, sentence_tokens):
+        # Pure lookups: nothing is inserted for unseen words, so memory stays
+        # flat no matter how many sentences are classified.
+        self._ensure_tables()
         scores = {}
-        vocab_size = len(self.vocab)
 
         for label in self.classes:
-            scores[label] = self.log_priors[label]
+            table = self.log_likelihoods[label]
+            unknown = self.unknown_log_probs[label]
+            score = self.log_priors[label]
 
             for word in sentence_tokens:
-                # Laplace Smoothing
-                # Unknown words get count 0
-                numerator = self.word_counts[label][word] + 1
-                denominator = self.class_total_words[label] + vocab_size
-                
-                scores[label] += math.log(numerator / denominator)
+                score += table.get(word, unknown)
+
+            scores[label] = score
+
+        return max(scores, key=scores.get)
+
+    def _build_batch_tables(self):
+        """
+        Class x (vocab + 1) log-likelihood matrix for predict_batch. The last
+        column holds each class's unknown-word value; vocab words never seen
+        with a class get that value in their column too.
+        """
+        labels = list(self.classes)   # same order predict() iterates in
+        word_index = {word: i for i, word in enumerate(self.vocab)}
+        unknown_col = len(word_index)
+
+        table = np.empty((len(labels), unknown_col + 1))
+        for row, label in enumerate(labels):
+            table[row, :] = self.unknown_log_probs[label]
+            for word, value in self.log_likelihoods[label].items():
+                table[row, word_index[word]] = value
+
+        log_priors = np.array([self.log_priors[label] for label in labels])
+        self._batch_tables = (labels, word_index, table.T.copy(), log_priors)
+
+    def predict_batch(self, list_of_token_lists):
+        """
+        Vectorized predict(): builds a sparse document-term count matrix and
+        scores every class with one matrix product. Rows whose two best scores
+        are within rounding distance are re-scored with predict(), so the
+        result is always identical to calling predict() per sentence.
+        """
+        if np is None or not self.classes:
+            return [self.predict(tokens) for tokens in list_of_token_lists]
+        self._ensure_tables()
+        if self._batch_tables is None:
+            self._build_batch_tables()
+        labels, word_index, table, log_priors = self._batch_tables
+        unknown_col = len(word_index)
+
+        # Token -> column lookups run in C via map(); row boundaries come from lengths
+        num_docs = len(list_of_token_lists)
+        indptr = np.zeros(num_docs + 1, dtype=np.int64)
+        np.cumsum(np.fromiter(map(len, list_of_token_lists), dtype=np.int64, count=num_docs),
+                  out=indptr[1:])
+        flat_tokens = chain.from_iterable(list_of_token_lists)
+        indices = np.fromiter(map(word_index.get, flat_tokens, repeat(unknown_col)),
+                              dtype=np.int64, count=int(indptr[-1]))
+
+        # Duplicate column indices inside a row are summed by the product
+        counts = sparse.csr_matrix((np.ones(len(indices)), indices, indptr),
+                                   shape=(num_docs, unknown_col + 1))
+        scores = counts @ table + log_priors
+
+        best = scores.argmax(axis=1)
+        predictions = [labels[i] for i in best]
+
+        if len(labels) > 1:
+            top_two = np.sort(scores, axis=1)[:, -2:]
+            gap = top_two[:, 1] - top_two[:, 0]
+            close = gap <= 1e-9 * np.maximum(1.0, np.abs(top_two[:, 1]))
+            for row in np.flatnonzero(close):
+                predictions[row] = self.predict(list_of_token_lists[row])
+
+        return predictions
+
+    # --------------------------------------------------------------------------
+    # Persistence
+    # File layout (little-endian):
+    #   header      : magic, num_classes, vocab_size, blob_len
+    #   doc counts  : uint64[num_classes]
+    #   total words : uint64[num_classes]
+    #   counts      : uint32[num_classes * vocab_size], one column per class
+    #   strings     : UTF-8 labels then vocab words, "\n"-separated (tokens
+    #                 never contain whitespace)
+    # Counts are stored (not log-probs) so a loaded model can keep training.
+    # HashedNaiveBayesClassifier uses the same layout with its own magic:
+    # one count row per hash bucket instead of per word, and no words.
+    # --------------------------------------------------------------------------
+    def save(self, path):
+        labels = list(self.classes)
+        words = list(self.vocab)
+        counts = array('I')
+        for label in labels:
+            label_counts = self.word_counts[label]
+            counts.extend(label_counts.get(word, 0) for word in words)
+        _write_model_file(path, MODEL_MAGIC, labels, len(words), self.class_doc_counts,
+                          self.class_total_words, counts, words)
+
+    @classmethod
+    def load(cls, path):
+        """Load a saved model; hashed model files come back as HashedNaiveBayesClassifier."""
+        magic, labels, vocab_size, doc_counts, total_words, counts, words = _read_model_file(path)
+        if magic == HASHED_MODEL_MAGIC and cls is NaiveBayesClassifier:
+            return HashedNaiveBayesClassifier.load(path)
+        if magic != MODEL_MAGIC:
+            raise ValueError(f"'{path}' is not a Naive Bayes model file")
+
+        model = cls()
+        model.classes = set(labels)
+        model.vocab = set(words)
+        for i, label in enumerate(labels):
+            model.class_doc_counts[label] = doc_counts[i]
+            model.class_total_words[label] = total_words[i]
+            column = counts[i * vocab_size:(i + 1) * vocab_size]
+            model.word_counts[label] = Counter({word: n for word, n in zip(words, column) if n})
+        model._stale = True
+        return model
+
+# ------------------------------------------------------------------------------
+# Class: CappedNaiveBayesClassifier
+# Description: Bounded-memory variant that keeps exact counts for at most
+#              max_vocab words. The vocabulary is pruned to the max_vocab most
+#              frequent words whenever it grows past 2 * max_vocab, and once
+#              more before the tables are built. Class token totals stay exact.
+# ------------------------------------------------------------------------------
+class CappedNaiveBayesClassifier(NaiveBayesClassifier):
+    PRUNE_EVERY = 1000  # documents between vocabulary size checks
+
+    def __init__(self, max_vocab):
+        super().__init__()
+        self.max_vocab = max_vocab
+
+    def partial_fit(self, batch):
+        batch = iter(batch)
+        while True:
+            docs = list(islice(batch, self.PRUNE_EVERY))
+            if not docs:
+                return self
+            super().partial_fit(docs)
+            if len(self.vocab) > 2 * self.max_vocab:
+                self._prune(self.max_vocab)
+
+    def _prune(self, keep):
+        totals = Counter()
+        for label in self.classes:
+            totals.update(self.word_counts[label])
+        kept = {word for word, _ in totals.most_common(keep)}
+        for label in self.classes:
+            self.word_counts[label] = Counter(
+                {word: count for word, count in self.word_counts[label].items() if word in kept})
+        self.vocab = kept
+        self._stale = True
+
+    def _ensure_tables(self):
+        if len(self.vocab) > self.max_vocab:
+            self._prune(self.max_vocab)
+        super()._ensure_tables()
+
+# ------------------------------------------------------------------------------
+# Class: HashedNaiveBayesClassifier
+# Description: Bounded-memory variant that never stores words at all. Each
+#              word is hashed (crc32, stable across processes) into one of
+#              num_buckets buckets and counts live in one array('I') per
+#              class, so memory is fixed up front. Colliding words share a
+#              count; the number of occupied buckets stands in for |V|.
+# ------------------------------------------------------------------------------
+class HashedNaiveBayesClassifier(NaiveBayesClassifier):
+    def __init__(self, num_buckets):
+        super().__init__()
+        self.num_buckets = num_buckets
+        self.bucket_counts = {}          # label -> array('I') of bucket counts
+        self.occupied = bytearray(num_buckets)
+        self.bucket_log_probs = {}       # label -> array('d') of log P(bucket | label)
+
+    def _bucket(self, word):
+        return zlib.crc32(word.encode('utf-8')) % self.num_buckets
+
+    def train(self, training_data):
+        self.class_doc_counts = defaultdict(int)
+        self.class_total_words = defaultdict(int)
+        self.bucket_counts = {}
+        self.occupied = bytearray(self.num_buckets)
+        self.classes = set()
+        self.partial_fit(training_data)
+
+    def partial_fit(self, batch):
+        for tokens, label in batch:
+            if label not in self.bucket_counts:
+                self.bucket_counts[label] = array('I', [0]) * self.num_buckets
+            self.classes.add(label)
+            self.class_doc_counts[label] += 1
+
+            counts = self.bucket_counts[label]
+            for word in tokens:
+                bucket = self._bucket(word)
+                counts[bucket] += 1
+                self.occupied[bucket] = 1
+            self.class_total_words[label] += len(tokens)
+
+        self._stale = True
+        return self
+
+    def _check_compatible(self, other):
+        if not isinstance(other, HashedNaiveBayesClassifier) or other.num_buckets != self.num_buckets:
+            raise ValueError("can only combine hashed models with the same number of buckets")
+
+    def merge(self, other):
+        """Element-wise sum of the bucket columns (see NaiveBayesClassifier.merge)."""
+        self._check_compatible(other)
+        for label in other.classes:
+            self.classes.add(label)
+            self.class_doc_counts[label] += other.class_doc_counts[label]
+            self.class_total_words[label] += other.class_total_words[label]
+            if label not in self.bucket_counts:
+                self.bucket_counts[label] = array('I', [0]) * self.num_buckets
+            counts = self.bucket_counts[label]
+            for bucket, count in enumerate(other.bucket_counts[label]):
+                if count:
+                    counts[bucket] += count
+        for bucket, flag in enumerate(other.occupied):
+            if flag:
+                self.occupied[bucket] = 1
+
+        self._stale = True
+        return self
+
+    def subtract(self, other):
+        """
+        Element-wise difference of the bucket columns (the inverse of merge).
+        Buckets left empty in every class stop counting towards the
+        vocabulary size, like words leaving the vocabulary in the base class.
+        """
+        self._check_compatible(other)
+        for label in other.classes:
+            self.class_doc_counts[label] -= other.class_doc_counts[label]
+            self.class_total_words[label] -= other.class_total_words[label]
+            counts = self.bucket_counts[label]
+            for bucket, count in enumerate(other.bucket_counts[label]):
+                if count:
+                    counts[bucket] = max(0, counts[bucket] - count)
+            if self.class_doc_counts[label] <= 0:
+                self.classes.discard(label)
+                del self.class_doc_counts[label]
+                del self.class_total_words[label]
+                del self.bucket_counts[label]
+
+        self._refresh_occupied()
+        self._stale = True
+        return self
+
+    def _refresh_occupied(self):
+        self.occupied = bytearray(self.num_buckets)
+        for counts in self.bucket_counts.values():
+            for bucket, count in enumerate(counts):
+                if count:
+                    self.occupied[bucket] = 1
+
+    def copy(self):
+        return HashedNaiveBayesClassifier(self.num_buckets).merge(self)
+
+    def save(self, path):
+        """Same layout as NaiveBayesClassifier.save, with num_buckets rows per class."""
+        labels = list(self.classes)
+        counts = array('I')
+        for label in labels:
+            counts.extend(self.bucket_counts[label])
+        _write_model_file(path, HASHED_MODEL_MAGIC, labels, self.num_buckets,
+                          self.class_doc_counts, self.class_total_words, counts)
+
+    @classmethod
+    def load(cls, path):
+        magic, labels, num_buckets, doc_counts, total_words, counts, _ = _read_model_file(path)
+        if magic != HASHED_MODEL_MAGIC:
+            raise ValueError(f"'{path}' is not a hashed Naive Bayes model file")
+
+        model = cls(num_buckets)
+        model.classes = set(labels)
+        for i, label in enumerate(labels):
+            model.class_doc_counts[label] = doc_counts[i]
+            model.class_total_words[label] = total_words[i]
+            model.bucket_counts[label] = counts[i * num_buckets:(i + 1) * num_buckets]
+        model._refresh_occupied()
+        model._stale = True
+        return model
+
+    def _freeze(self):
+        vocab_size = sum(self.occupied)
+        total_docs = sum(self.class_doc_counts[label] for label in self.classes)
+        self.log_priors = {}
+        self.bucket_log_probs = {}
+
+        for label in self.classes:
+            self.log_priors[label] = math.log(self.class_doc_counts[label] / total_docs)
+            denominator = self.class_total_words[label] + vocab_size
+            self.bucket_log_probs[label] = array(
+                'd', (math.log((count + 1) / denominator) for count in self.bucket_counts[label]))
+
+        self._stale = False
+
+    def predict(self, sentence_tokens):
+        self._ensure_tables()
+        buckets = [self._bucket(word) for word in sentence_tokens]
+        scores = {}
+
+        for label in self.classes:
+            table = self.bucket_log_probs[label]
+            score = self.log_priors[label]
+            for bucket in buckets:
+                score += table[bucket]
+            scores[label] = score
 
         return max(scores, key=scores.get)
 
+    def predict_batch(self, list_of_token_lists):
+        return [self.predict(tokens) for tokens in list_of_token_lists]
+
+# ------------------------------------------------------------------------------
+# Function: trained_size
+# Description: Trains a model under tracemalloc and returns it with the number
+#              of bytes it holds once its prediction tables are built.
+# ------------------------------------------------------------------------------
+def trained_size(model, train_data):
+    tracemalloc.start()
+    try:
+        model.train(train_data)
+        model._ensure_tables()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return model, size
+
+# ------------------------------------------------------------------------------
+# Function: bounded_memory_report
+# Description: Compares a bounded-memory model with exact counting on the same
+#              split: accuracy, and bytes held by each trained model.
+# ------------------------------------------------------------------------------
+def bounded_memory_report(bounded_model, train_data, val_data):
+    exact, exact_bytes = trained_size(NaiveBayesClassifier(), train_data)
+    bounded, bounded_bytes = trained_size(bounded_model, train_data)
+    exact_acc = evaluate(exact, val_data)
+    bounded_acc = evaluate(bounded, val_data)
+
+    if isinstance(bounded, HashedNaiveBayesClassifier):
+        name = f"Hashed ({bounded.num_buckets} buckets)"
+    else:
+        name = f"Top-K vocab (K={bounded.max_vocab})"
+    print("\n--- Bounded-Memory Report ---")
+    print(f"{'Model':<28} | {'Memory':>10} | {'Accuracy':>9}")
+    print("-" * 54)
+    print(f"{'Exact counts':<28} | {exact_bytes / 1024:>7.1f} KB | {exact_acc * 100:>8.2f}%")
+    print(f"{name:<28} | {bounded_bytes / 1024:>7.1f} KB | {bounded_acc * 100:>8.2f}%")
+    print("-" * 54)
+    print(f"Accuracy cost: {(exact_acc - bounded_acc) * 100:+.2f} points at "
+          f"{bounded_bytes / max(exact_bytes, 1) * 100:.1f}% of exact memory")
+    return bounded
+
 # ------------------------------------------------------------------------------
 # Function: evaluate
 # ------------------------------------------------------------------------------
 def evaluate(model, validation_data):
+    if not validation_data:
+        return 0
+    predictions = model.predict_batch([tokens for tokens, _ in validation_data])
     correct = 0
-    for tokens, label in validation_data:
-        prediction = model.predict(tokens)
+    for prediction, (_, label) in zip(predictions, validation_data):
         if prediction == label:
             correct += 1
-    return correct / len(validation_data) if validation_data else 0
+    return correct / len(validation_data)
+
+# ------------------------------------------------------------------------------
+# Cross-validation
+# Each fold is counted once; the model for fold i is "total counts minus fold
+# i's counts" instead of a retrain on the other k - 1 folds. Folds are scored
+# in a process pool that receives the total model once per worker.
+# ------------------------------------------------------------------------------
+_cv_total = None
+
+def _init_cv_worker(total_model):
+    global _cv_total
+    _cv_total = total_model
+
+def _score_fold(task):
+    fold_model, fold_data = task
+    start = time.perf_counter()
+    model = _cv_total.copy().subtract(fold_model)
+    accuracy = evaluate(model, fold_data)
+    return accuracy, time.perf_counter() - start
+
+def cross_validate(data, k=5, repeats=1, seed=42, workers=None):
+    """
+    Repeated k-fold cross-validation. Returns one dict per fold with the
+    repeat, fold index, accuracy and wall time (fold model build + scoring).
+    """
+    if k < 2 or len(data) < k:
+        raise ValueError(f"Need k >= 2 and at least k sentences (k={k}, n={len(data)})")
+
+    results = []
+    workers = workers or os.cpu_count() or 1
+    for rep in range(repeats):
+        shuffled = list(data)
+        random.Random(seed + rep).shuffle(shuffled)
+        folds = [shuffled[i * len(shuffled) // k:(i + 1) * len(shuffled) // k] for i in range(k)]
+
+        fold_models = [NaiveBayesClassifier().partial_fit(fold) for fold in folds]
+        total = NaiveBayesClassifier()
+        for fold_model in fold_models:
+            total.merge(fold_model)
+
+        tasks = list(zip(fold_models, folds))
+        if workers <= 1:
+            _init_cv_worker(total)
+            scores = list(map(_score_fold, tasks))
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, k), initializer=_init_cv_worker,
+                                     initargs=(total,)) as pool:
+                scores = list(pool.map(_score_fold, tasks))
+
+        for fold, (accuracy, seconds) in enumerate(scores):
+            results.append({"repeat": rep, "fold": fold, "accuracy": accuracy, "seconds": seconds})
+    return results
+
+def print_cv_report(results, k, repeats):
+    print(f"\n--- {repeats} x {k}-fold Cross-Validation ---")
+    print(f"{'Repeat':>6} | {'Fold':>4} | {'Accuracy':>9} | {'Time (ms)':>9}")
+    print("-" * 40)
+    for row in results:
+        print(f"{row['repeat']:>6} | {row['fold']:>4} | {row['accuracy'] * 100:>8.2f}% | "
+              f"{row['seconds'] * 1000:>9.2f}")
+    accuracies = [row["accuracy"] for row in results]
+    stdev = statistics.stdev(accuracies) if len(accuracies) > 1 else 0.0
+    print("-" * 40)
+    print(f"Mean Accuracy : {statistics.mean(accuracies) * 100:.2f}% (stdev {stdev * 100:.2f})")
+    print(f"Mean Fold Time: {statistics.mean(row['seconds'] for row in results) * 1000:.2f} ms")
 
 # ------------------------------------------------------------------------------
 # Main Execution Block
 # ------------------------------------------------------------------------------
-def main():
-    print("\n--- Naive Bayes Sentiment Classifier (Optimized) ---")
-    
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Naive Bayes Sentiment Classifier")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="processes used to tokenize the training files (default: 1) "
+                             "and to run --cv folds (default: CPU count)")
+    parser.add_argument("--model", metavar="PATH",
+                        help="load a prebuilt model from PATH instead of training")
+    parser.add_argument("--save", metavar="PATH",
+                        help="save the trained model to PATH")
+    parser.add_argument("--cv", type=int, metavar="K",
+                        help="run K-fold cross-validation on pos/neg data and exit")
+    parser.add_argument("--repeats", type=int, default=1,
+                        help="number of shuffled repeats for --cv")
+    bounded = parser.add_mutually_exclusive_group()
+    bounded.add_argument("--buckets", type=int, metavar="N",
+                         help="bounded memory: hash word counts into N buckets per class")
+    bounded.add_argument("--max-vocab", type=int, metavar="K",
+                         help="bounded memory: keep counts for the K most frequent words only")
+    bounded.add_argument("--budget-kb", type=int, metavar="KB",
+                         help="bounded memory: hashed counts sized to fit in KB kilobytes")
+    return parser.parse_args(argv)
+
+# ------------------------------------------------------------------------------
+# Function: build_model
+# Description: Loads pos/neg data, trains on an 80/20 split and reports
+#              validation accuracy.
+# ------------------------------------------------------------------------------
+def build_model(workers=1, num_buckets=None, max_vocab=None):
     # 1. Load Data
     print("Loading and preprocessing data...")
-    pos_data = load_data('pos.txt', 'POSITIVE')
-    neg_data = load_data('neg.txt', 'NEGATIVE')
+    pos_data = list(load_data('pos.txt', 'POSITIVE', workers))
+    neg_data = list(load_data('neg.txt', 'NEGATIVE', workers))
     
     all_data = pos_data + neg_data
     random.seed(42) # Set seed for reproducibility
@@ -170,12 +797,58 @@ def main():
     
     # 3. Train Model
     print("\nTraining model...")
-    classifier = NaiveBayesClassifier()
-    classifier.train(train_data)
+    if num_buckets or max_vocab:
+        if num_buckets:
+            bounded = HashedNaiveBayesClassifier(num_buckets)
+        else:
+            bounded = CappedNaiveBayesClassifier(max_vocab)
+        classifier = bounded_memory_report(bounded, train_data, val_data)
+    else:
+        classifier = NaiveBayesClassifier()
+        classifier.train(train_data)
     
     # 4. Evaluate
     accuracy = evaluate(classifier, val_data)
     print(f"Validation Accuracy: {accuracy * 100:.2f}%")
+    return classifier
+
+def main():
+    args = parse_args(sys.argv[1:])
+    print("\n--- Naive Bayes Sentiment Classifier (Optimized) ---")
+
+    if args.cv:
+        data = list(load_data('pos.txt', 'POSITIVE', args.workers or 1))
+        data += load_data('neg.txt', 'NEGATIVE', args.workers or 1)
+        start = time.perf_counter()
+        results = cross_validate(data, args.cv, args.repeats, workers=args.workers)
+        print_cv_report(results, args.cv, args.repeats)
+        print(f"Total Wall Time: {(time.perf_counter() - start) * 1000:.2f} ms")
+        return
+
+    if args.model:
+        # Prebuilt model: no data loading or retraining before the first query
+        start = time.perf_counter()
+        try:
+            classifier = NaiveBayesClassifier.load(args.model)
+        except FileNotFoundError:
+            print(f"Error: File '{args.model}' not found.")
+            sys.exit(1)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if isinstance(classifier, HashedNaiveBayesClassifier):
+            size = f"{classifier.num_buckets} hash buckets, {sum(classifier.occupied)} in use"
+        else:
+            size = f"{len(classifier.vocab)} words"
+        print(f"Loaded model '{args.model}' ({size}) in {elapsed_ms:.2f} ms")
+    else:
+        num_buckets = args.buckets
+        if args.budget_kb:
+            # Two classes, each holding a 4-byte count and an 8-byte log prob per bucket.
+            num_buckets = max(1, args.budget_kb * 1024 // (2 * 12))
+        classifier = build_model(args.workers or 1, num_buckets, args.max_vocab)
+
+    if args.save:
+        classifier.save(args.save)
+        print(f"Model saved to '{args.save}'")
     print("-" * 40)
 
     # 5. Interactive Loop
@@ -0,0 +1,72 @@
+# ==============================================================================
+# File Name   : M25CSA003_prob3_bench.py
+# Author      : Akshat Jain
+# Roll Number : M25CSA003
+# Description : Benchmarks for the Naive Bayes Sentiment Classifier
+#               - Scalar predict() loop vs vectorized predict_batch()
+# Usage       : python M25CSA003_prob3_bench.py [--sentences 100000]
+# ==============================================================================
+
+import argparse
+import random
+import time
+
+from M25CSA003_prob3 import NaiveBayesClassifier, load_data
+
+# ------------------------------------------------------------------------------
+# Function: synthetic_sentences
+# Description: Builds a large evaluation set by resampling the real training
+#              sentences and shuffling/dropping/borrowing tokens, so vocabulary
+#              and unknown-word rates stay realistic.
+# ------------------------------------------------------------------------------
+def synthetic_sentences(data, count, seed=0):
+    rnd = random.Random(seed)
+    all_words = [word for tokens, _ in data for word in tokens]
+    sentences = []
+    for _ in range(count):
+        tokens, _ = rnd.choice(data)
+        tokens = [word for word in tokens if rnd.random() > 0.2]
+        tokens += rnd.sample(all_words, rnd.randint(0, 4))
+        if rnd.random() < 0.3:
+            tokens.append(f"unseen_{rnd.randint(0, 10**6)}")
+        rnd.shuffle(tokens)
+        sentences.append(tokens)
+    return sentences
+
+# ------------------------------------------------------------------------------
+# Function: bench_predict_batch
+# ------------------------------------------------------------------------------
+def bench_predict_batch(model, sentences):
+    start = time.perf_counter()
+    scalar = [model.predict(tokens) for tokens in sentences]
+    scalar_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = model.predict_batch(sentences)
+    batch_time = time.perf_counter() - start
+
+    mismatches = sum(a != b for a, b in zip(scalar, batch))
+    print(f"\n--- predict() vs predict_batch() on {len(sentences)} sentences ---")
+    print(f"Scalar predict loop : {scalar_time:8.3f} s ({len(sentences) / scalar_time:,.0f} sentences/sec)")
+    print(f"predict_batch       : {batch_time:8.3f} s ({len(sentences) / batch_time:,.0f} sentences/sec)")
+    print(f"Speedup             : {scalar_time / batch_time:8.2f}x")
+    print(f"Mismatches          : {mismatches}")
+    return mismatches == 0
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Naive Bayes sentiment classifier.")
+    parser.add_argument("--sentences", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    data = list(load_data('pos.txt', 'POSITIVE')) + list(load_data('neg.txt', 'NEGATIVE'))
+    model = NaiveBayesClassifier()
+    model.train(data)
+
+    sentences = synthetic_sentences(data, args.sentences, args.seed)
+    ok = bench_predict_batch(model, sentences)
+    if not ok:
+        raise SystemExit("predict_batch() disagreed with predict()")
+
+if __name__ == "__main__":
+    main()
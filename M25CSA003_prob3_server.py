@@ -0,0 +1,280 @@
+# ==============================================================================
+# File Name   : M25CSA003_prob3_server.py
+# Author      : Akshat Jain
+# Roll Number : M25CSA003
+# Description : Asynchronous prediction server for the Naive Bayes Sentiment
+#               Classifier in M25CSA003_prob3.py
+#               - Line-delimited JSON over TCP, many concurrent clients
+#               - Requests are grouped into micro-batches (max size / max wait)
+#                 and scored with one predict_batch() call per batch
+#               - p50/p99 latency and throughput counters via {"cmd": "stats"}
+#               - Built-in load generator for local testing
+# Usage       : python M25CSA003_prob3_server.py serve [--model PATH]
+#                   [--port 8765] [--max-batch 64] [--max-wait-ms 2]
+#               python M25CSA003_prob3_server.py loadgen [--port 8765]
+#                   [--concurrency 50] [--requests 20000]
+# Protocol    : request  {"id": 1, "text": "not a good movie"}
+#               response {"id": 1, "label": "NEGATIVE"}
+# ==============================================================================
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from collections import deque
+
+from M25CSA003_prob3 import NaiveBayesClassifier, build_model, preprocess_text
+
+LATENCY_WINDOW = 100000  # most recent request latencies kept for percentiles
+
+# ------------------------------------------------------------------------------
+# Function: percentile
+# Description: Nearest-rank percentile of an already sorted list.
+# ------------------------------------------------------------------------------
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+# ------------------------------------------------------------------------------
+# Class: ServerStats
+# Description: Request/batch counters plus a sliding window of per-request
+#              latencies (enqueue -> result), measured inside the server.
+# ------------------------------------------------------------------------------
+class ServerStats:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.requests = 0
+        self.batches = 0
+        self.errors = 0
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+
+    def record_batch(self, latencies):
+        self.batches += 1
+        self.requests += len(latencies)
+        self.latencies.extend(latencies)
+
+    def snapshot(self):
+        elapsed = time.perf_counter() - self.started
+        ordered = sorted(self.latencies)
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "errors": self.errors,
+            "mean_batch_size": self.requests / self.batches if self.batches else 0.0,
+            "uptime_s": elapsed,
+            "throughput_rps": self.requests / elapsed if elapsed else 0.0,
+            "p50_ms": percentile(ordered, 50) * 1000,
+            "p99_ms": percentile(ordered, 99) * 1000,
+        }
+
+# ------------------------------------------------------------------------------
+# Class: MicroBatcher
+# Description: Collects pending requests from a queue. A batch is flushed as
+#              soon as it holds max_batch requests, or max_wait seconds after
+#              its first request arrived, whichever comes first.
+# ------------------------------------------------------------------------------
+class MicroBatcher:
+    def __init__(self, model, max_batch=64, max_wait=0.002):
+        self.model = model
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.queue = asyncio.Queue()
+        self.stats = ServerStats()
+
+    async def predict(self, text):
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((text, time.perf_counter(), future))
+        return await future
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            self._score(batch)
+
+    def _score(self, batch):
+        try:
+            labels = self.model.predict_batch([preprocess_text(text) for text, _, _ in batch])
+        except Exception as exc:
+            self.stats.errors += len(batch)
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        done = time.perf_counter()
+        for (_, _, future), label in zip(batch, labels):
+            if not future.done():
+                future.set_result(label)
+        self.stats.record_batch([done - enqueued for _, enqueued, _ in batch])
+
+# ------------------------------------------------------------------------------
+# Function: handle_client
+# Description: One task per connection. Each request line is dispatched to its
+#              own task so a client may pipeline many requests; responses are
+#              written as they complete and carry the request id.
+# ------------------------------------------------------------------------------
+async def handle_client(batcher, reader, writer):
+    pending = set()
+
+    async def answer(request):
+        try:
+            if request.get("cmd") == "stats":
+                response = batcher.stats.snapshot()
+            else:
+                response = {"id": request.get("id"), "label": await batcher.predict(str(request["text"]))}
+        except Exception as exc:
+            response = {"id": request.get("id"), "error": str(exc)}
+        writer.write((json.dumps(response) + "\n").encode("utf-8"))
+
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("request must be a JSON object")
+            except ValueError as exc:
+                batcher.stats.errors += 1
+                writer.write((json.dumps({"error": f"bad request: {exc}"}) + "\n").encode("utf-8"))
+                continue
+            task = asyncio.ensure_future(answer(request))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+            await writer.drain()
+        if pending:
+            await asyncio.gather(*pending)
+        await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+async def serve(model, host, port, max_batch, max_wait):
+    batcher = MicroBatcher(model, max_batch, max_wait)
+    worker = asyncio.ensure_future(batcher.run())
+    server = await asyncio.start_server(
+        lambda r, w: handle_client(batcher, r, w), host, port, limit=1 << 20)
+    print(f"Serving on {host}:{port} (max batch {max_batch}, max wait {max_wait * 1000:g} ms)")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        worker.cancel()
+        print(json.dumps(batcher.stats.snapshot(), indent=1))
+
+# ------------------------------------------------------------------------------
+# Load generator
+# Description: `concurrency` connections each send requests one at a time
+#              (closed loop) and time the round trip. Prints client-side
+#              latency percentiles, throughput and the server's own counters.
+# ------------------------------------------------------------------------------
+SAMPLE_TEXTS = [
+    "a wonderful and moving film",
+    "not good at all, boring and too long",
+    "the plot was dull but the acting was great",
+    "i did not like it",
+    "one of the best movies of the year",
+    "terrible script and worse direction",
+]
+
+async def _client(host, port, count, texts, latencies, seed):
+    rnd = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    for i in range(count):
+        request = {"id": i, "text": rnd.choice(texts)}
+        start = time.perf_counter()
+        writer.write((json.dumps(request) + "\n").encode("utf-8"))
+        await writer.drain()
+        response = json.loads(await reader.readline())
+        latencies.append(time.perf_counter() - start)
+        if "label" not in response:
+            raise RuntimeError(f"server error: {response}")
+    writer.close()
+
+async def _server_stats(host, port):
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(b'{"cmd": "stats"}\n')
+    await writer.drain()
+    stats = json.loads(await reader.readline())
+    writer.close()
+    return stats
+
+async def loadgen(host, port, concurrency, total, texts):
+    latencies = []
+    per_client = max(1, total // concurrency)
+    start = time.perf_counter()
+    await asyncio.gather(*(_client(host, port, per_client, texts, latencies, seed)
+                           for seed in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+
+    print(f"\n--- Load Test: {len(latencies)} requests, {concurrency} connections ---")
+    print(f"Throughput   : {len(latencies) / elapsed:,.0f} requests/sec")
+    print(f"Client p50   : {percentile(latencies, 50) * 1000:.2f} ms")
+    print(f"Client p99   : {percentile(latencies, 99) * 1000:.2f} ms")
+    stats = await _server_stats(host, port)
+    print(f"Server p50   : {stats['p50_ms']:.2f} ms")
+    print(f"Server p99   : {stats['p99_ms']:.2f} ms")
+    print(f"Mean batch   : {stats['mean_batch_size']:.1f} requests")
+
+def read_texts(path):
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        return [line.strip() for line in f if line.strip()]
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Micro-batching sentiment prediction server")
+    sub = parser.add_subparsers(dest="mode", required=True)
+
+    server = sub.add_parser("serve", help="run the prediction server")
+    server.add_argument("--host", default="127.0.0.1")
+    server.add_argument("--port", type=int, default=8765)
+    server.add_argument("--model", metavar="PATH",
+                        help="load a saved model instead of training on pos/neg data")
+    server.add_argument("--max-batch", type=int, default=64,
+                        help="largest number of requests scored together")
+    server.add_argument("--max-wait-ms", type=float, default=2.0,
+                        help="longest time a request waits for its batch to fill")
+
+    client = sub.add_parser("loadgen", help="drive a running server with concurrent clients")
+    client.add_argument("--host", default="127.0.0.1")
+    client.add_argument("--port", type=int, default=8765)
+    client.add_argument("--concurrency", type=int, default=50)
+    client.add_argument("--requests", type=int, default=20000)
+    client.add_argument("--texts", metavar="FILE",
+                        help="one sentence per line to sample from (default: built-in samples)")
+    return parser.parse_args(argv)
+
+def main():
+    args = parse_args(sys.argv[1:])
+    if args.mode == "loadgen":
+        texts = read_texts(args.texts) if args.texts else SAMPLE_TEXTS
+        asyncio.run(loadgen(args.host, args.port, args.concurrency, args.requests, texts))
+        return
+
+    if args.model:
+        model = NaiveBayesClassifier.load(args.model)
+    else:
+        model = build_model()
+    try:
+        asyncio.run(serve(model, args.host, args.port, args.max_batch, args.max_wait_ms / 1000))
+    except KeyboardInterrupt:
+        print("\nShutting down...")
+
+if __name__ == "__main__":
+    main()
@@ -4,25 +4,72 @@
 # Description : Sports vs Politics Classifier
 #               Compare 3 Models: Naive Bayes, Logistic Regression, Random Forest
 #               Includes Interactive Prediction Mode.
+#               --stream trains out-of-core (chunked CSV, hashed features).
+#               --batch FILE classifies a text/JSONL/CSV file in chunks.
+#               --export-scorer PATH writes the best linear model for the
+#               dependency-free M25CSA003_prob4_scorer.py.
 # ==============================================================================
 
+import argparse
+import csv
+import hashlib
+import json
+import os
+import pickle
 import pandas as pd
 import numpy as np
 import sys
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from scipy import sparse
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
 
 # Scikit-learn imports
+import sklearn
 from sklearn.model_selection import train_test_split
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import TfidfVectorizer, HashingVectorizer
 from sklearn.naive_bayes import MultinomialNB
-from sklearn.linear_model import LogisticRegression
+from sklearn.linear_model import LogisticRegression, SGDClassifier
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
 
+from M25CSA003_prob4_scorer import save_artifact
+
 # ------------------------------------------------------------------------------
 # 1. Configuration & Setup
 # ------------------------------------------------------------------------------
 CSV_FILE = 'bbc_news_text_complexity_summarization.csv'
 TARGET_LABELS = ['sport', 'politics']
+TFIDF_PARAMS = {'stop_words': 'english', 'max_features': 5000}
+
+# Feature cache: parsed labels + TF-IDF matrix, keyed by CSV contents and settings
+CACHE_DIR = '.prob4_cache'
+CACHE_VERSION = 1  # bump when the cleaning in clean_text changes
+
+LATENCY_DOCS = 200  # test documents timed one at a time for predict latency
+LINEAR_MODELS = (LogisticRegression, MultinomialNB)  # exportable with --export-scorer
+
+# Streaming (out-of-core) mode
+STREAM_CHUNK_ROWS = 1000
+HASH_FEATURES = 2 ** 18
+HOLDOUT_BUCKETS = 5  # 1 in 5 documents (by text hash) is held out for evaluation
+
+# Batch inference
+BATCH_CHUNK_DOCS = 2000
+MODEL_VERSION = 1  # bump when the save_model artifact layout changes
+
+def clean_text(texts):
+    """
+    Lowercase, drop newlines and strip a Series of documents.
+    """
+    return texts.str.replace('\n', ' ').str.lower().str.strip()
 
 def load_and_preprocess_data(filepath):
     """
@@ -42,7 +89,7 @@ def load_and_preprocess_data(filepath):
     df_filtered = df_filtered[['text', 'labels']].dropna()
 
     # Basic Cleaning: Lowercase and remove newlines
-    df_filtered['text'] = df_filtered['text'].str.replace('\n', ' ').str.lower().str.strip()
+    df_filtered['text'] = clean_text(df_filtered['text'])
     
     print(f"Data loaded successfully! Total samples: {len(df_filtered)}")
     print(f"Sports: {len(df_filtered[df_filtered['labels']=='sport'])}")
@@ -50,19 +97,311 @@ def load_and_preprocess_data(filepath):
     
     return df_filtered
 
+# ------------------------------------------------------------------------------
+# 1b. Feature Cache
+# ------------------------------------------------------------------------------
+def feature_cache_key(filepath, tfidf_params):
+    """
+    Content address for the parse + vectorize stages: sha256 of the CSV bytes
+    plus everything that changes their output (labels, TF-IDF settings,
+    cleaning version, scikit-learn version).
+    """
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    settings = {
+        'labels': TARGET_LABELS,
+        'tfidf': tfidf_params,
+        'cache_version': CACHE_VERSION,
+        'sklearn': sklearn.__version__,
+    }
+    digest.update(json.dumps(settings, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+def _atomic_write(path, write):
+    """Write via a temp file + rename so readers never see a partial file."""
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, 'wb') as f:
+        write(f)
+    os.replace(tmp_path, path)
+
+def save_feature_cache(cache_dir, key, X, y, tfidf):
+    """
+    Store the TF-IDF matrix as a sparse .npz, and labels, vocabulary (terms in
+    column order) and idf weights in a second .npz. No pickles.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    prefix = os.path.join(cache_dir, key)
+    _atomic_write(prefix + '.meta.npz', lambda f: np.savez(
+        f,
+        labels=np.asarray(y, dtype=str),
+        terms=tfidf.get_feature_names_out().astype(str),
+        idf=tfidf.idf_,
+    ))
+    _atomic_write(prefix + '.npz', lambda f: sparse.save_npz(f, X.tocsr()))
+
+def load_feature_cache(cache_dir, key, tfidf_params):
+    """
+    Returns (X, y, tfidf) from the cache, or None on a miss. The vectorizer is
+    rebuilt from the stored vocabulary and idf, so transform() behaves exactly
+    like the one fitted on the CSV.
+    """
+    prefix = os.path.join(cache_dir, key)
+    try:
+        with np.load(prefix + '.meta.npz') as meta:
+            labels, terms, idf = meta['labels'], meta['terms'], meta['idf']
+        X = sparse.load_npz(prefix + '.npz').tocsr()
+    except (OSError, KeyError, ValueError):
+        return None
+
+    tfidf = TfidfVectorizer(**tfidf_params)
+    tfidf.vocabulary_ = {term: i for i, term in enumerate(terms.tolist())}
+    tfidf.idf_ = idf
+    return X, pd.Series(labels, name='labels'), tfidf
+
+def build_features(filepath, cache_dir=CACHE_DIR):
+    """
+    Parse + TF-IDF stages, served from the feature cache when the CSV and
+    settings are unchanged (pass cache_dir=None to always recompute).
+    Prints per-stage timings. Returns (X_vectorized, y, tfidf).
+    """
+    timings = []
+    key = None
+    if cache_dir:
+        start = time.perf_counter()
+        try:
+            key = feature_cache_key(filepath, TFIDF_PARAMS)
+        except FileNotFoundError:
+            print(f"Error: File '{filepath}' not found. Make sure it is in the same folder.")
+            sys.exit(1)
+        timings.append(('hash', time.perf_counter() - start))
+
+        start = time.perf_counter()
+        cached = load_feature_cache(cache_dir, key, TFIDF_PARAMS)
+        if cached is not None:
+            timings.append(('cache load', time.perf_counter() - start))
+            X, y, tfidf = cached
+            print(f"Loaded cached features for '{filepath}' ({X.shape[0]} docs x {X.shape[1]} terms)")
+            print_timings(timings, "parse + vectorize skipped")
+            return X, y, tfidf
+
+    # Step 1: Prepare Data
+    start = time.perf_counter()
+    df = load_and_preprocess_data(filepath)
+    timings.append(('parse', time.perf_counter() - start))
+
+    # Step 2: Vectorization (TF-IDF)
+    print("\nExtracting features using TF-IDF...")
+    start = time.perf_counter()
+    tfidf = TfidfVectorizer(**TFIDF_PARAMS)
+
+    # Fit on all data to ensure vocabulary consistency
+    X_vectorized = tfidf.fit_transform(df['text'])
+    timings.append(('vectorize', time.perf_counter() - start))
+
+    if key:
+        start = time.perf_counter()
+        save_feature_cache(cache_dir, key, X_vectorized, df['labels'], tfidf)
+        timings.append(('cache write', time.perf_counter() - start))
+    print_timings(timings)
+    return X_vectorized, df['labels'], tfidf
+
+def print_timings(timings, note=None):
+    line = " | ".join(f"{stage} {seconds:.3f}s" for stage, seconds in timings)
+    total = sum(seconds for _, seconds in timings)
+    print(f"Stage timings: {line} | total {total:.3f}s" + (f" ({note})" if note else ""))
+
 # ------------------------------------------------------------------------------
 # 2. Model Training & Evaluation
 # ------------------------------------------------------------------------------
-def train_and_evaluate(X_train, X_test, y_train, y_test):
+def fit_model(name, model, X_train, y_train):
+    """
+    Fit one candidate (run inside a worker process).
+    Returns (name, fitted model, fit time in seconds).
+    """
+    start = time.perf_counter()
+    model.fit(X_train, y_train)
+    return name, model, time.perf_counter() - start
+
+def measure_model(model, X_test, y_test, latency_docs=LATENCY_DOCS):
+    """
+    Accuracy plus serving costs of a fitted model:
+    median single-document predict latency (ms), whole-test-set batch
+    throughput (docs/sec) and pickled size (KB).
+    """
+    start = time.perf_counter()
+    y_pred = model.predict(X_test)
+    batch_time = time.perf_counter() - start
+
+    latencies = []
+    for i in range(min(latency_docs, X_test.shape[0])):
+        row = X_test[i]
+        start = time.perf_counter()
+        model.predict(row)
+        latencies.append(time.perf_counter() - start)
+
+    return {
+        'accuracy': accuracy_score(y_test, y_pred),
+        'latency_ms': float(np.median(latencies)) * 1000,
+        'throughput': X_test.shape[0] / batch_time if batch_time else float('inf'),
+        'size_kb': len(pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)) / 1024,
+    }
+
+def train_and_evaluate(X_train, X_test, y_train, y_test, workers=None, tie_break=None):
     """
     Train 3 different models and print their performance.
-    Returns the best model for interactive use.
+    The models are fitted concurrently in a process pool (workers=1 fits them
+    in this process), Random Forest with the cores left over per worker.
+    Accuracy, latency, throughput and size are then measured here one model
+    at a time, single-threaded, so the timings do not compete for CPU.
+    Ties on accuracy are settled by pick_best().
+    Returns (best model for interactive use, best linear model for
+    export_scorer).
     """
     models = {
         "Multinomial Naive Bayes": MultinomialNB(),
         "Logistic Regression": LogisticRegression(max_iter=1000),
         "Random Forest": RandomForestClassifier(n_estimators=100, random_state=42)
     }
+    cpus = os.cpu_count() or 1
+    workers = workers or min(len(models), cpus)
+    # Only the cores the pool leaves free, so the fits do not oversubscribe the CPU
+    models["Random Forest"].set_params(n_jobs=max(1, cpus // workers))
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(fit_model, name, model, X_train, y_train)
+                       for name, model in models.items()]
+            fitted = [future.result() for future in futures]
+    else:
+        fitted = [fit_model(name, model, X_train, y_train) for name, model in models.items()]
+
+    print("\n" + "="*90)
+    print(f"{'Model Name':<25} | {'Accuracy':<10} | {'Fit (s)':>8} | {'Latency (ms)':>12} | "
+          f"{'Docs/sec':>10} | {'Size (KB)':>9}")
+    print("="*90)
+
+    results = []
+    for name, model, fit_time in fitted:
+        if 'n_jobs' in model.get_params():
+            # Serve single-threaded: per-document latency should not time joblib dispatch
+            model.set_params(n_jobs=1)
+        m = measure_model(model, X_test, y_test)
+        print(f"{name:<25} | {m['accuracy']*100:>9.2f}% | {fit_time:>8.2f} | {m['latency_ms']:>12.3f} | "
+              f"{m['throughput']:>10,.0f} | {m['size_kb']:>9,.1f}")
+        results.append((model, m['accuracy'], m['latency_ms']))
+
+    # Keep track of best model (Logistic Regression usually wins here)
+    best_model = pick_best(results, tie_break)
+    best_linear = pick_best([r for r in results if isinstance(r[0], LINEAR_MODELS)], tie_break)
+
+    print("="*90)
+    print(f"Fitted with {workers} worker process(es); best: {type(best_model).__name__}")
+    return best_model, best_linear
+
+def pick_best(results, tie_break=None):
+    """
+    Best model from [(model, accuracy, latency_ms)] in table order. Ties on
+    accuracy go to the later model, or to the lowest latency when
+    tie_break == 'latency'.
+    """
+    best_model = None
+    best_accuracy = 0
+    best_latency = float('inf')
+    for model, acc, latency in results:
+        if tie_break == 'latency' and acc == best_accuracy:
+            better = latency < best_latency
+        else:
+            better = acc >= best_accuracy
+        if better:
+            best_accuracy = acc
+            best_latency = latency
+            best_model = model
+    return best_model
+
+# ------------------------------------------------------------------------------
+# 2b. Streaming (Out-of-Core) Training
+# ------------------------------------------------------------------------------
+def iter_labelled_chunks(filepath, chunksize=STREAM_CHUNK_ROWS):
+    """
+    Read the CSV chunksize rows at a time, applying the same label filter and
+    cleaning as load_and_preprocess_data. Yields (texts, labels, is_holdout),
+    where is_holdout marks a stable ~1/HOLDOUT_BUCKETS of documents chosen by
+    a crc32 of the text, so every pass sees the same split.
+    """
+    for chunk in pd.read_csv(filepath, chunksize=chunksize, usecols=['text', 'labels']):
+        chunk = chunk[chunk['labels'].isin(TARGET_LABELS)].dropna()
+        if chunk.empty:
+            continue
+        texts = clean_text(chunk['text'])
+        is_holdout = np.fromiter(
+            (zlib.crc32(text.encode('utf-8')) % HOLDOUT_BUCKETS == 0 for text in texts),
+            dtype=bool, count=len(texts))
+        yield texts.to_numpy(), chunk['labels'].to_numpy(), is_holdout
+
+def peak_rss_mb():
+    """Peak resident memory of this process so far (None if unknown)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+def train_streaming(filepath, chunksize=STREAM_CHUNK_ROWS, epochs=1):
+    """
+    Out-of-core training: the CSV is never fully in memory. A stateless
+    HashingVectorizer (non-negative, so MultinomialNB can use it) turns each
+    chunk into features; models learn with partial_fit over `epochs` passes
+    on the training stream, then one more pass scores the held-out stream.
+    Memory depends on chunksize and HASH_FEATURES, not on the CSV size.
+    Returns (vectorizer, best model).
+    """
+    vectorizer = HashingVectorizer(stop_words='english', n_features=HASH_FEATURES,
+                                   alternate_sign=False, norm='l2')
+    models = {
+        "Multinomial Naive Bayes": MultinomialNB(),
+        "Logistic Regression (SGD)": SGDClassifier(loss='log_loss', random_state=42),
+    }
+
+    print(f"Streaming '{filepath}' in chunks of {chunksize} rows...")
+    try:
+        start = time.perf_counter()
+        train_docs = 0
+        for _ in range(epochs):
+            for texts, labels, is_holdout in iter_labelled_chunks(filepath, chunksize):
+                train = ~is_holdout
+                if not train.any():
+                    continue
+                X_chunk = vectorizer.transform(texts[train])
+                for model in models.values():
+                    model.partial_fit(X_chunk, labels[train], classes=TARGET_LABELS)
+                train_docs += int(train.sum())
+        train_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        correct = dict.fromkeys(models, 0)
+        test_docs = 0
+        for texts, labels, is_holdout in iter_labelled_chunks(filepath, chunksize):
+            if not is_holdout.any():
+                continue
+            X_chunk = vectorizer.transform(texts[is_holdout])
+            for name, model in models.items():
+                correct[name] += int((model.predict(X_chunk) == labels[is_holdout]).sum())
+            test_docs += int(is_holdout.sum())
+        eval_time = time.perf_counter() - start
+    except FileNotFoundError:
+        print(f"Error: File '{filepath}' not found. Make sure it is in the same folder.")
+        sys.exit(1)
+
+    if test_docs == 0:
+        print("Error: no held-out documents to evaluate on.")
+        sys.exit(1)
+
+    print(f"Trained on {train_docs} docs ({epochs} epoch(s)) in {train_time:.2f}s, "
+          f"evaluated on {test_docs} held-out docs in {eval_time:.2f}s")
+    peak = peak_rss_mb()
+    if peak is not None:
+        print(f"Peak RSS: {peak:.1f} MB")
 
     best_model = None
     best_accuracy = 0
@@ -70,52 +409,286 @@ def train_and_evaluate(X_train, X_test, y_train, y_test):
     print("\n" + "="*60)
     print(f"{'Model Name':<25} | {'Accuracy':<10}")
     print("="*60)
-
     for name, model in models.items():
-        # Train
-        model.fit(X_train, y_train)
-        
-        # Predict
-        y_pred = model.predict(X_test)
-        
-        # Evaluate
-        acc = accuracy_score(y_test, y_pred)
+        acc = correct[name] / test_docs
         print(f"{name:<25} | {acc*100:.2f}%")
-        
-        # Keep track of best model (Logistic Regression usually wins here)
         if acc >= best_accuracy:
             best_accuracy = acc
             best_model = model
-
     print("="*60)
-    return best_model
+    return vectorizer, best_model
 
 # ------------------------------------------------------------------------------
-# 3. Main Execution
+# 2c. Batch Inference
 # ------------------------------------------------------------------------------
-def main():
-    # Step 1: Prepare Data
-    df = load_and_preprocess_data(CSV_FILE)
-    
-    X = df['text']
-    y = df['labels']
+def save_model(path, vectorizer, model):
+    """Pickle the fitted vectorizer + classifier together as one artifact."""
+    artifact = {
+        'model_version': MODEL_VERSION,
+        'sklearn': sklearn.__version__,
+        'vectorizer': vectorizer,
+        'model': model,
+    }
+    _atomic_write(path, lambda f: pickle.dump(artifact, f, protocol=pickle.HIGHEST_PROTOCOL))
+    print(f"Saved model to '{path}'")
 
-    # Step 2: Vectorization (TF-IDF)
-    print("\nExtracting features using TF-IDF...")
-    tfidf = TfidfVectorizer(stop_words='english', max_features=5000)
-    
-    # Fit on all data to ensure vocabulary consistency
-    X_vectorized = tfidf.fit_transform(X)
-    
-    # Step 3: Split Data (80% Train, 20% Test)
-    X_train, X_test, y_train, y_test = train_test_split(
-        X_vectorized, y, test_size=0.2, random_state=42, stratify=y
-    )
+def load_model(path):
+    """
+    Returns (vectorizer, model) from a save_model() artifact. Only load files
+    you created yourself: this unpickles.
+    """
+    with open(path, 'rb') as f:
+        artifact = pickle.load(f)
+    if artifact.get('model_version') != MODEL_VERSION:
+        raise ValueError(f"'{path}' is not a model artifact (version {MODEL_VERSION})")
+    if artifact['sklearn'] != sklearn.__version__:
+        print(f"Warning: model saved with scikit-learn {artifact['sklearn']}, "
+              f"running {sklearn.__version__}", file=sys.stderr)
+    return artifact['vectorizer'], artifact['model']
 
-    # Step 4: Run Models
-    best_model = train_and_evaluate(X_train, X_test, y_train, y_test)
+def classify_texts(vectorizer, model, texts):
+    """
+    Label a list of raw documents with one transform and one predict_proba
+    call. Returns (labels, confidences); the label is the argmax column of
+    predict_proba, so it matches model.predict().
+    """
+    cleaned = [str(text).replace('\n', ' ').lower().strip() for text in texts]
+    proba = model.predict_proba(vectorizer.transform(cleaned))
+    best = proba.argmax(axis=1)
+    return model.classes_[best], proba[np.arange(len(best)), best]
 
-    # Step 5: Interactive Mode
+# Set in each batch worker by _init_batch_worker (and in-process for workers=1)
+_batch_vectorizer = None
+_batch_model = None
+
+def _init_batch_worker(vectorizer, model):
+    """
+    Pool initializer: the model is handed over once per worker (inherited on
+    fork, unpickled once on spawn) instead of once per chunk.
+    """
+    global _batch_vectorizer, _batch_model
+    _batch_vectorizer, _batch_model = vectorizer, model
+
+def _score_chunk(task):
+    """
+    Worker for run_batch. Text chunks are raw lines and come back as
+    'label<TAB>confidence' lines; JSONL chunks come back as serialized records
+    with label/confidence added; CSV chunks are lists of cells (document in
+    column `key`) and come back with label and confidence cells appended.
+    """
+    fmt, items, key = task
+    if fmt == 'text':
+        texts = [line.rstrip('\r\n') for line in items]
+    elif fmt == 'csv':
+        texts = [row[key] for row in items]
+    else:
+        records, texts, out = [], [], []
+        for line in items:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+                if not isinstance(record, dict):
+                    raise ValueError("record is not a JSON object")
+            except ValueError as exc:
+                out.append({'error': f"bad record: {exc}", 'line': line})
+                continue
+            out.append(record)
+            records.append(record)
+            texts.append(record.get(key) or '')
+        items = out
+
+    if texts:
+        labels, confidences = classify_texts(_batch_vectorizer, _batch_model, texts)
+    else:
+        labels, confidences = [], []
+
+    if fmt == 'text':
+        return [f"{label}\t{conf:.4f}" for label, conf in zip(labels, confidences)]
+    if fmt == 'csv':
+        return [row + [label, f"{conf:.4f}"] for row, label, conf in zip(items, labels, confidences)]
+    for record, label, conf in zip(records, labels, confidences):
+        record['label'] = str(label)
+        record['confidence'] = round(float(conf), 4)
+    return [json.dumps(record) for record in items]
+
+def _fixed_width_rows(reader, width, counts):
+    """
+    CSV rows cut or padded to the header's width, so a ragged line cannot
+    break the output. counts['ragged'] tallies the rows that lost cells.
+    """
+    for row in reader:
+        if len(row) > width:
+            counts['ragged'] += 1
+            row = row[:width]
+        elif len(row) < width:
+            row = row + [''] * (width - len(row))
+        yield row
+
+def _scored_chunks(tasks, workers, vectorizer, model):
+    """
+    _score_chunk results in task order: in this process for workers <= 1,
+    otherwise from a pool that keeps at most 2 chunks per worker in flight.
+    """
+    if workers <= 1:
+        _init_batch_worker(vectorizer, model)
+        yield from map(_score_chunk, tasks)
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                             initargs=(vectorizer, model)) as pool:
+        in_flight = deque()
+        for task in tasks:
+            in_flight.append(pool.submit(_score_chunk, task))
+            if len(in_flight) >= 2 * workers:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
+
+def run_batch(vectorizer, model, source, dest='-', fmt=None, workers=1,
+              chunk_size=BATCH_CHUNK_DOCS, text_field='text'):
+    """
+    Classify every document in `source` (a path, or '-' for stdin) and write
+    the results to `dest` in input order. Formats: 'text' (one document per
+    line), 'jsonl' or 'csv' (document in `text_field`); by default taken from
+    the file extension. CSV output is the input columns plus label and
+    confidence; cells beyond the header are dropped and counted.
+    Reports documents/sec on stderr.
+    """
+    if fmt is None:
+        path = (dest if source == '-' else source).lower()
+        fmt = 'csv' if path.endswith('.csv') else 'jsonl' if path.endswith('.jsonl') else 'text'
+
+    fin = sys.stdin if source == '-' else open(source, 'r', encoding='utf-8', newline='')
+    fout = sys.stdout if dest == '-' else open(dest, 'w', encoding='utf-8', newline='')
+    start = time.perf_counter()
+    count = 0
+    counts = {'ragged': 0}
+    try:
+        key = text_field
+        if fmt == 'csv':
+            reader = csv.reader(fin)
+            header = next(reader, [])
+            if text_field not in header:
+                raise ValueError(f"CSV has no '{text_field}' column (use --text-field)")
+            key = header.index(text_field)
+            writer = csv.writer(fout)
+            writer.writerow(header + ['label', 'confidence'])
+            records, write = _fixed_width_rows(reader, len(header), counts), writer.writerows
+        else:
+            records = fin
+            write = lambda lines: fout.write(''.join(line + '\n' for line in lines))
+
+        chunks = iter(lambda: list(islice(records, chunk_size)), [])
+        for results in _scored_chunks(((fmt, chunk, key) for chunk in chunks),
+                                      workers, vectorizer, model):
+            count += len(results)
+            write(results)
+    finally:
+        if fin is not sys.stdin:
+            fin.close()
+        if fout is not sys.stdout:
+            fout.close()
+        else:
+            fout.flush()
+
+    elapsed = time.perf_counter() - start
+    print(f"Classified {count} documents in {elapsed:.2f} s "
+          f"({count / elapsed if elapsed else 0:,.0f} docs/sec)", file=sys.stderr)
+    if counts['ragged']:
+        print(f"Warning: {counts['ragged']} CSV row(s) had more cells than the header; "
+              f"the extra cells were dropped", file=sys.stderr)
+    return count
+
+# ------------------------------------------------------------------------------
+# 2d. Fast-Start Scorer Export
+# ------------------------------------------------------------------------------
+def export_scorer(path, tfidf, model):
+    """
+    Write the TF-IDF vocabulary, idf weights, stop words and the weights of a
+    LogisticRegression or MultinomialNB to the array-backed artifact read by
+    M25CSA003_prob4_scorer.py, which scores without pandas or scikit-learn.
+    """
+    if not isinstance(tfidf, TfidfVectorizer):
+        raise ValueError("only TF-IDF features can be exported (not --stream hashed features)")
+    settings = tfidf.get_params()
+    unsupported = {
+        'analyzer': 'word', 'ngram_range': (1, 1), 'strip_accents': None, 'preprocessor': None,
+        'tokenizer': None, 'binary': False, 'use_idf': True, 'norm': 'l2', 'sublinear_tf': False,
+    }
+    changed = [name for name, value in unsupported.items() if settings[name] != value]
+    if changed:
+        raise ValueError(f"TF-IDF settings not supported by the scorer: {', '.join(changed)}")
+
+    if isinstance(model, LogisticRegression):
+        kind, weights, bias = 'logistic', model.coef_, model.intercept_
+    elif isinstance(model, MultinomialNB):
+        kind, weights, bias = 'multinomial_nb', model.feature_log_prob_, model.class_log_prior_
+    else:
+        raise ValueError(f"{type(model).__name__} is not a linear model the scorer supports")
+
+    header = {
+        'kind': kind,
+        'classes': [str(label) for label in model.classes_],
+        'token_pattern': settings['token_pattern'],
+        'lowercase': settings['lowercase'],
+        'stop_words': sorted(tfidf.get_stop_words() or ()),
+        'terms': tfidf.get_feature_names_out().tolist(),
+        'sklearn': sklearn.__version__,
+    }
+    arrays = {
+        'idf': tfidf.idf_,
+        'weights': np.ascontiguousarray(weights, dtype=np.float64).ravel(),
+        'bias': np.asarray(bias, dtype=np.float64),
+    }
+    save_artifact(path, header, arrays)
+    print(f"Exported {type(model).__name__} scorer to '{path}' "
+          f"({os.path.getsize(path) / 1024:,.1f} KB)")
+
+# ------------------------------------------------------------------------------
+# 3. Main Execution
+# ------------------------------------------------------------------------------
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Sports vs Politics Classifier")
+    parser.add_argument("--csv", default=CSV_FILE, help="BBC news CSV file")
+    parser.add_argument("--cache-dir", default=CACHE_DIR,
+                        help="directory for the parsed-feature cache")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="always re-parse and re-vectorize the CSV")
+    parser.add_argument("--stream", action="store_true",
+                        help="out-of-core training: chunked CSV, hashed features, partial_fit")
+    parser.add_argument("--chunksize", type=int, default=STREAM_CHUNK_ROWS,
+                        help="rows per chunk in --stream mode")
+    parser.add_argument("--epochs", type=int, default=1,
+                        help="passes over the training stream in --stream mode")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="processes used to fit the models (default: one per model, up to CPU count) "
+                             "or to score --batch chunks (default: 1)")
+    parser.add_argument("--tie-break", choices=["latency"], default=None,
+                        help="on equal accuracy prefer the lowest predict latency (default: last model)")
+    parser.add_argument("--save-model", metavar="PATH",
+                        help="pickle the trained vectorizer + best model to PATH")
+    parser.add_argument("--model", metavar="PATH",
+                        help="load a --save-model artifact instead of training")
+    parser.add_argument("--batch", metavar="FILE",
+                        help="classify documents from FILE ('-' for stdin) instead of interactive mode")
+    parser.add_argument("--out", default="-", metavar="FILE",
+                        help="batch output file (default: stdout)")
+    parser.add_argument("--format", choices=["text", "jsonl", "csv"],
+                        help="batch input format (default: from the file extension, else text)")
+    parser.add_argument("--text-field", default="text",
+                        help="JSONL/CSV field holding the document in batch mode")
+    parser.add_argument("--batch-chunk", type=int, default=BATCH_CHUNK_DOCS,
+                        help="documents per chunk (one transform + predict_proba each) in batch mode")
+    parser.add_argument("--export-scorer", metavar="PATH",
+                        help="write the best linear model to PATH for M25CSA003_prob4_scorer.py")
+    return parser.parse_args(argv)
+
+def interactive_mode(vectorizer, model):
+    """
+    Classify headlines typed by the user until 'exit'. Works with any fitted
+    vectorizer (TF-IDF or hashing) and probabilistic classifier.
+    """
     print("\n--- Interactive Mode ---")
     print("Type a news headline to classify (or type 'exit' to quit).")
     
@@ -128,11 +701,11 @@ def main():
             
             # Preprocess user input exactly like training data
             cleaned_input = user_input.lower().replace('\n', ' ').strip()
-            input_vector = tfidf.transform([cleaned_input])
+            input_vector = vectorizer.transform([cleaned_input])
             
             # Predict
-            prediction = best_model.predict(input_vector)[0]
-            probability = best_model.predict_proba(input_vector).max() * 100
+            prediction = model.predict(input_vector)[0]
+            probability = model.predict_proba(input_vector).max() * 100
             
             # Show Result with Confidence
             icon = "" if prediction == "sport" else ""
@@ -141,5 +714,58 @@ def main():
         except KeyboardInterrupt:
             break
 
+def main():
+    args = parse_args(sys.argv[1:])
+
+    if args.model:
+        # Steps 1-4 already done: load the saved vectorizer + model
+        try:
+            tfidf, best_model = load_model(args.model)
+            best_linear = best_model if isinstance(best_model, LINEAR_MODELS) else None
+        except (OSError, ValueError, pickle.UnpicklingError) as exc:
+            print(f"Error: cannot load model '{args.model}': {exc}")
+            sys.exit(1)
+    elif args.stream:
+        # Steps 1-4 in bounded memory: chunked read, hashed features, partial_fit
+        tfidf, best_model = train_streaming(args.csv, args.chunksize, args.epochs)
+        best_linear = best_model
+    else:
+        # Steps 1-2: Prepare Data + TF-IDF (cached)
+        X_vectorized, y, tfidf = build_features(args.csv, None if args.no_cache else args.cache_dir)
+
+        # Step 3: Split Data (80% Train, 20% Test)
+        X_train, X_test, y_train, y_test = train_test_split(
+            X_vectorized, y, test_size=0.2, random_state=42, stratify=y
+        )
+
+        # Step 4: Run Models
+        best_model, best_linear = train_and_evaluate(X_train, X_test, y_train, y_test,
+                                                     args.workers, args.tie_break)
+
+    if args.save_model:
+        save_model(args.save_model, tfidf, best_model)
+    if args.export_scorer:
+        try:
+            export_scorer(args.export_scorer, tfidf, best_linear)
+        except ValueError as exc:
+            print(f"Error: cannot export scorer: {exc}")
+            sys.exit(1)
+
+    if args.batch:
+        # Step 5 (batch): classify a whole file
+        try:
+            run_batch(tfidf, best_model, args.batch, args.out, args.format,
+                      args.workers or 1, args.batch_chunk, args.text_field)
+        except FileNotFoundError as exc:
+            print(f"Error: File '{exc.filename}' not found.")
+            sys.exit(1)
+        except ValueError as exc:
+            print(f"Error: {exc}")
+            sys.exit(1)
+        return
+
+    # Step 5: Interactive Mode
+    interactive_mode(tfidf, best_model)
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,119 @@
+# ==============================================================================
+# File Name   : M25CSA003_prob4_bench.py
+# Author      : Akshat Jain (M25CSA003)
+# Description : Checks and benchmarks for the fast-start scorer
+#               - Exports Naive Bayes and Logistic Regression with
+#                 export_scorer() and checks M25CSA003_prob4_scorer.py gives
+#                 the same labels and probabilities as scikit-learn
+#               - Cold start: import -> load -> first prediction in a fresh
+#                 interpreter, full pipeline (pandas + scikit-learn + pickled
+#                 model) vs the standalone scorer
+# Usage       : python M25CSA003_prob4_bench.py [--csv FILE] [--runs 5]
+# ==============================================================================
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from M25CSA003_prob4 import (CSV_FILE, TFIDF_PARAMS, LogisticRegression, MultinomialNB,
+                             TfidfVectorizer, classify_texts, export_scorer,
+                             load_and_preprocess_data, save_model, train_test_split)
+from M25CSA003_prob4_scorer import LinearScorer
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+HEADLINE = "Minister defends election pledge as striker scores late winner"
+
+# Edge cases for tokenization: empty, no known words, unicode, digits, case
+EXTRA_TEXTS = ["", "   ", "!!! ???", "THE AND OF", "Café déjà vu — naïve élan",
+               "a b c 1 22 333", "under_score MiXeD CaSe\nnew line", "x" * 500]
+
+# ------------------------------------------------------------------------------
+# Function: compare
+# Description: Scorer vs scikit-learn on the same raw texts.
+# Returns: (label mismatches, largest absolute probability difference)
+# ------------------------------------------------------------------------------
+def compare(scorer, tfidf, model, texts):
+    labels, _ = classify_texts(tfidf, model, texts)
+    cleaned = [text.replace('\n', ' ').lower().strip() for text in texts]
+    expected = model.predict_proba(tfidf.transform(cleaned))
+
+    mismatches = 0
+    max_diff = 0.0
+    for text, label, row in zip(texts, labels, expected):
+        got_label, _ = scorer.predict(text)
+        mismatches += got_label != label
+        got = scorer.predict_proba(text)
+        max_diff = max(max_diff, max(abs(a - b) for a, b in zip(got, row)))
+    return mismatches, max_diff
+
+# ------------------------------------------------------------------------------
+# Function: cold_start
+# Description: Median over `runs` fresh interpreters of (wall time of the
+#              process, time from the first import to the first prediction
+#              measured inside it), in seconds.
+# ------------------------------------------------------------------------------
+def cold_start(code, runs):
+    walls, inner = [], []
+    for _ in range(runs):
+        start = time.perf_counter()
+        out = subprocess.run([sys.executable, "-c", code], cwd=HERE, check=True,
+                             capture_output=True, text=True).stdout
+        walls.append(time.perf_counter() - start)
+        inner.append(float(out.split()[-1]))
+    return statistics.median(walls), statistics.median(inner)
+
+def main():
+    parser = argparse.ArgumentParser(description="Check and benchmark the fast-start scorer.")
+    parser.add_argument("--csv", default=CSV_FILE)
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per cold-start timing")
+    args = parser.parse_args()
+
+    df = load_and_preprocess_data(args.csv)
+    texts_train, texts_test, y_train, y_test = train_test_split(
+        df['text'].tolist(), df['labels'], test_size=0.2, random_state=42, stratify=df['labels'])
+    tfidf = TfidfVectorizer(**TFIDF_PARAMS)
+    X_train = tfidf.fit_transform(texts_train)
+    texts = texts_test + EXTRA_TEXTS
+
+    failed = False
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"\n--- Scorer vs scikit-learn on {len(texts)} documents ---")
+        for model in (MultinomialNB(), LogisticRegression(max_iter=1000)):
+            model.fit(X_train, y_train)
+            path = os.path.join(tmp, f"{type(model).__name__}.bin")
+            export_scorer(path, tfidf, model)
+            mismatches, max_diff = compare(LinearScorer.load(path), tfidf, model, texts)
+            print(f"{type(model).__name__:<20} : {mismatches} label mismatches, "
+                  f"max |p - p_sklearn| = {max_diff:.2e}")
+            failed |= mismatches > 0 or max_diff > 1e-9
+
+        # Cold start with the Logistic Regression exported last
+        pickle_path = os.path.join(tmp, "model.pkl")
+        save_model(pickle_path, tfidf, model)
+        full = cold_start(
+            "import time; t = time.perf_counter()\n"
+            "import M25CSA003_prob4 as p\n"
+            f"v, m = p.load_model({pickle_path!r})\n"
+            f"p.classify_texts(v, m, [{HEADLINE!r}])\n"
+            "print(time.perf_counter() - t)", args.runs)
+        fast = cold_start(
+            "import time; t = time.perf_counter()\n"
+            "from M25CSA003_prob4_scorer import LinearScorer\n"
+            f"LinearScorer.load({path!r}).predict({HEADLINE!r})\n"
+            "print(time.perf_counter() - t)", args.runs)
+
+    print(f"\n--- Cold start, median of {args.runs} fresh interpreters ---")
+    print(f"{'':<34} | {'process (ms)':>12} | {'import -> first prediction (ms)':>31}")
+    print(f"{'Full pipeline (pandas + sklearn)':<34} | {full[0] * 1000:>12.1f} | {full[1] * 1000:>31.1f}")
+    print(f"{'M25CSA003_prob4_scorer':<34} | {fast[0] * 1000:>12.1f} | {fast[1] * 1000:>31.1f}")
+    print(f"Speedup (import -> first prediction): {full[1] / fast[1]:.1f}x")
+
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+# ==============================================================================
+# File Name   : M25CSA003_prob4_scorer.py
+# Author      : Akshat Jain (M25CSA003)
+# Description : Fast-start scorer for the Sports vs Politics classifier
+#               - Standard library only: no pandas, NumPy or scikit-learn
+#               - Loads the compact artifact written by
+#                 `M25CSA003_prob4.py --export-scorer PATH` (TF-IDF vocabulary,
+#                 IDF weights, stop words and the weights of the best linear
+#                 model: Logistic Regression or Multinomial Naive Bayes)
+#               - Reproduces scikit-learn's tokenization, TF-IDF (l2 norm)
+#                 and predict_proba for those models
+# Usage       : python M25CSA003_prob4_scorer.py MODEL ["headline" ...]
+#               (no headlines: one document per line on stdin)
+# ==============================================================================
+
+import json
+import math
+import re
+import struct
+import sys
+import time
+from array import array
+
+# ------------------------------------------------------------------------------
+# 1. Artifact Format
+# ------------------------------------------------------------------------------
+# magic | uint32 version | uint32 header length | JSON header | float64 arrays
+# The header lists the arrays (name, length) in file order; arrays are stored
+# little-endian. weights holds one row of n_terms values per score row, row-major.
+ARTIFACT_MAGIC = b'P4SCORER'
+ARTIFACT_VERSION = 1
+ARRAY_NAMES = ('idf', 'weights', 'bias')
+
+def save_artifact(path, header, arrays):
+    """
+    Write `header` (JSON-serializable dict) and the float arrays named in
+    ARRAY_NAMES (any iterables of floats) to `path`.
+    """
+    blobs = []
+    layout = []
+    for name in ARRAY_NAMES:
+        values = array('d', arrays[name])
+        layout.append([name, len(values)])
+        if sys.byteorder == 'big':
+            values.byteswap()
+        blobs.append(values.tobytes())
+    meta = json.dumps(dict(header, arrays=layout), separators=(',', ':')).encode('utf-8')
+
+    with open(path, 'wb') as f:
+        f.write(ARTIFACT_MAGIC)
+        f.write(struct.pack('<II', ARTIFACT_VERSION, len(meta)))
+        f.write(meta)
+        for blob in blobs:
+            f.write(blob)
+
+def load_artifact(path):
+    """Returns (header, {name: array('d')}) from a save_artifact() file."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if data[:len(ARTIFACT_MAGIC)] != ARTIFACT_MAGIC:
+        raise ValueError(f"'{path}' is not a scorer artifact")
+    offset = len(ARTIFACT_MAGIC)
+    version, meta_len = struct.unpack_from('<II', data, offset)
+    if version != ARTIFACT_VERSION:
+        raise ValueError(f"'{path}' has artifact version {version}, expected {ARTIFACT_VERSION}")
+    offset += 8
+    header = json.loads(data[offset:offset + meta_len].decode('utf-8'))
+    offset += meta_len
+
+    arrays = {}
+    for name, length in header.pop('arrays'):
+        values = array('d')
+        values.frombytes(data[offset:offset + 8 * length])
+        if sys.byteorder == 'big':
+            values.byteswap()
+        arrays[name] = values
+        offset += 8 * length
+    if offset != len(data):
+        raise ValueError(f"'{path}' is truncated or has trailing data")
+    return header, arrays
+
+# ------------------------------------------------------------------------------
+# 2. Scorer
+# ------------------------------------------------------------------------------
+class LinearScorer:
+    """
+    predict_proba for an exported TF-IDF + linear model, computed in the same
+    order as scikit-learn (column-sorted sparse rows, then the dense weights),
+    so labels match exactly and probabilities to floating-point rounding.
+
+    kind 'logistic': scores = w.x + b; binary -> sigmoid of the single score,
+                     multiclass -> softmax.
+    kind 'multinomial_nb': scores = log P(x|c) + log P(c); probabilities are
+                     exp(scores - logsumexp(scores)).
+    """
+
+    def __init__(self, header, arrays):
+        self.kind = header['kind']
+        if self.kind not in ('logistic', 'multinomial_nb'):
+            raise ValueError(f"unsupported model kind '{self.kind}'")
+        self.classes = header['classes']
+        self.token_re = re.compile(header['token_pattern'])
+        self.lowercase = header['lowercase']
+        self.stop_words = frozenset(header['stop_words'])
+        self.vocabulary = {term: i for i, term in enumerate(header['terms'])}
+        self.idf = arrays['idf']
+
+        n_terms = len(self.idf)
+        weights = arrays['weights']
+        self.bias = list(arrays['bias'])
+        self.weights = [weights[i * n_terms:(i + 1) * n_terms] for i in range(len(self.bias))]
+
+    @classmethod
+    def load(cls, path):
+        return cls(*load_artifact(path))
+
+    def vectorize(self, text):
+        """TF-IDF features of one document as [(column, value)] sorted by column."""
+        text = text.replace('\n', ' ').lower().strip()  # clean_text() in prob4
+        if self.lowercase:
+            text = text.lower()
+        counts = {}
+        vocabulary = self.vocabulary
+        for token in self.token_re.findall(text):
+            if token in self.stop_words:
+                continue
+            column = vocabulary.get(token)
+            if column is not None:
+                counts[column] = counts.get(column, 0) + 1
+
+        features = [(column, count * self.idf[column]) for column, count in sorted(counts.items())]
+        norm = 0.0
+        for _, value in features:
+            norm += value * value
+        if norm == 0.0:
+            return features
+        norm = math.sqrt(norm)
+        return [(column, value / norm) for column, value in features]
+
+    def decision_scores(self, text):
+        features = self.vectorize(text)
+        scores = []
+        for row, bias in zip(self.weights, self.bias):
+            total = 0.0
+            for column, value in features:
+                total += value * row[column]
+            scores.append(total + bias)
+        return scores
+
+    def predict_proba(self, text):
+        scores = self.decision_scores(text)
+        if self.kind == 'logistic':
+            if len(scores) == 1:
+                p = 1.0 / (1.0 + math.exp(-scores[0]))
+                return [1 - p, p]
+            top = max(scores)
+            exps = [math.exp(s - top) for s in scores]
+            total = 0.0
+            for e in exps:
+                total += e
+            return [e / total for e in exps]
+
+        # logsumexp as in scikit-learn: the max terms are factored out exactly.
+        # Plain loops, not sum(): sum() is compensated on Python 3.12+.
+        top = max(scores)
+        n_top = scores.count(top)
+        rest = 0.0
+        for s in scores:
+            if s != top:
+                rest += math.exp(s - top)
+        rest /= n_top
+        log_total = math.log1p(rest) + math.log(n_top) + top
+        return [math.exp(s - log_total) for s in scores]
+
+    def predict(self, text):
+        """Returns (label, confidence) of one document."""
+        proba = self.predict_proba(text)
+        best = max(range(len(proba)), key=proba.__getitem__)  # first max, like argmax
+        return self.classes[best], proba[best]
+
+# ------------------------------------------------------------------------------
+# 3. Main Execution
+# ------------------------------------------------------------------------------
+def main():
+    start = time.perf_counter()
+    if len(sys.argv) < 2:
+        print("Usage: python M25CSA003_prob4_scorer.py MODEL [\"headline\" ...]")
+        sys.exit(2)
+    try:
+        scorer = LinearScorer.load(sys.argv[1])
+    except (OSError, ValueError) as exc:
+        print(f"Error: cannot load scorer '{sys.argv[1]}': {exc}")
+        sys.exit(1)
+
+    texts = sys.argv[2:] or (line.rstrip('\r\n') for line in sys.stdin)
+    first = None
+    for text in texts:
+        label, confidence = scorer.predict(text)
+        print(f"{label}\t{confidence:.4f}")
+        if first is None:
+            first = time.perf_counter() - start
+    if first is not None:
+        print(f"Load to first prediction: {first * 1000:.1f} ms", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()